@@ -4,6 +4,7 @@
 import time
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add src to path for imports
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -14,38 +15,58 @@ from utils.logger import setup_logger
 
 logger = setup_logger("browser_demo")
 
-def demo_browser_automation():
-    """Demonstrate browser automation capabilities."""
-    logger.info("🎬 Google Meet Browser Automation Demo")
-    logger.info("=" * 60)
+MENU = "\n".join((
+    "",
+    "=" * 40,
+    "🎮 INTERACTIVE DEMO MENU",
+    "=" * 40,
+    "1. Toggle microphone",
+    "2. Toggle camera",
+    "3. Send chat message",
+    "4. Play test tone",
+    "5. Listen for speech",
+    "6. Show meeting status",
+    "7. Leave meeting",
+    "=" * 40,
+))
+
+def demo_browser_automation(meeting_url: Optional[str] = None, headless: bool = False):
+    """Demonstrate browser automation capabilities.
+    
+    Args:
+        meeting_url: Meeting to join; when given, prompts and the interactive
+            menu are skipped so the demo can run unattended
+        headless: Whether to run browser in headless mode (unattended runs only)
+    """
+    interactive = meeting_url is None
+    
+    logger.info("🎬 Google Meet Browser Automation Demo\n%s", "=" * 60)
     
     # Show configuration
-    logger.info("📋 Current Configuration:")
-    config_info = Config.print_config()
-    for section, values in config_info.items():
-        logger.info(f"  {section}: {values}")
+    Config.print_status()
     
     # Ask user for meeting URL
-    print("\n" + "=" * 60)
-    print("🤖 BROWSER AUTOMATION DEMO")
-    print("=" * 60)
+    print("\n" + "=" * 60 + "\n🤖 BROWSER AUTOMATION DEMO\n" + "=" * 60)
     
-    meeting_url = input("Enter Google Meet URL (or press Enter to use config): ").strip()
-    if not meeting_url:
-        meeting_url = Config.GMEET_URL
-    
-    if not meeting_url:
-        logger.error("❌ No meeting URL provided. Please set GMEET_URL in .env or provide one above.")
-        return False
+    display_name = None
+    if interactive:
+        meeting_url = input("Enter Google Meet URL (or press Enter to use config): ").strip()
+        if not meeting_url:
+            meeting_url = Config.GMEET_URL
+        
+        if not meeting_url:
+            logger.error("❌ No meeting URL provided. Please set GMEET_URL in .env or provide one above.")
+            return False
+        
+        display_name = input("Enter display name (or press Enter for 'AI Assistant'): ").strip()
+        
+        # Ask about headless mode
+        headless_response = input("Run in headless mode? (y/N): ").strip().lower()
+        headless = headless_response == 'y'
     
-    display_name = input("Enter display name (or press Enter for 'AI Assistant'): ").strip()
     if not display_name:
         display_name = Config.AGENT_NAME or "AI Assistant"
     
-    # Ask about headless mode
-    headless_response = input("Run in headless mode? (y/N): ").strip().lower()
-    headless = headless_response == 'y'
-    
     print(f"\n🚀 Starting demo with:")
     print(f"  URL: {meeting_url}")
     print(f"  Name: {display_name}")
@@ -112,31 +133,21 @@ def demo_browser_automation():
             logger.info("  ⚠️  No speech detected")
         
         # Interactive menu
-        while True:
-            print(f"\n{'='*40}")
-            print("🎮 INTERACTIVE DEMO MENU")
-            print("=" * 40)
-            print("1. Toggle microphone")
-            print("2. Toggle camera") 
-            print("3. Send chat message")
-            print("4. Play test tone")
-            print("5. Listen for speech")
-            print("6. Show meeting status")
-            print("7. Leave meeting")
-            print("=" * 40)
+        while interactive:
+            print(MENU)
             
             choice = input("Enter choice (1-7): ").strip()
             
             if choice == "1":
                 # Toggle microphone
-                current_state = controller.agent.is_microphone_enabled()
+                current_state = controller.is_microphone_enabled()
                 new_state = not current_state if current_state is not None else True
                 controller.toggle_microphone(new_state)
                 logger.info(f"🎤 Microphone {'enabled' if new_state else 'disabled'}")
                 
             elif choice == "2":
                 # Toggle camera
-                current_state = controller.agent.is_camera_enabled()
+                current_state = controller.is_camera_enabled()
                 new_state = not current_state if current_state is not None else True
                 controller.toggle_camera(new_state)
                 logger.info(f"📹 Camera {'enabled' if new_state else 'disabled'}")
@@ -196,8 +207,8 @@ def demo_browser_automation():
             else:
                 print("❌ Invalid choice. Please enter 1-7.")
         
-        # Leave meeting
-        controller.leave_meeting()
+        # Leave the meeting and release the browser and audio streams
+        controller.close()
         logger.info("✅ Demo completed successfully!")
         
         return True
@@ -215,9 +226,15 @@ def demo_browser_automation():
         return False
 
 def main():
-    """Run the browser automation demo."""
+    """Run the browser automation demo.
+    
+    Usage: browser_demo.py [meeting_url] [--headless]
+    """
+    args = sys.argv[1:]
+    urls = [arg for arg in args if not arg.startswith("--")]
+    
     try:
-        success = demo_browser_automation()
+        success = demo_browser_automation(urls[0] if urls else None, "--headless" in args)
         print("\n" + "=" * 60)
         if success:
             print("🎉 Browser automation demo completed!")
@@ -21,7 +21,7 @@ from typing import Optional, Dict, Any
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.utils.config import Config
-from src.utils.logger import setup_logger
+from src.utils.logger import setup_logger, skip_record_extras
 from src.browser import MeetingController
 from src.ai import ConversationManager
 from src.audio import AudioCapture, VoiceActivityDetector
@@ -105,8 +105,7 @@ class GMeetAIAgent:
                 logger.error("❌ Meeting controller not initialized")
                 return False
             
-            success = await asyncio.to_thread(
-                self.meeting_controller.join_meeting,
+            success = await self.meeting_controller.ajoin_meeting(
                 url=url,
                 display_name=Config.AGENT_NAME
             )
@@ -119,7 +118,7 @@ class GMeetAIAgent:
             await asyncio.sleep(3)
             
             # Ensure microphone is enabled for speaking and keep it on by default
-            self.meeting_controller.toggle_microphone(True)
+            await self.meeting_controller.atoggle_microphone(True)
             if Config.KEEP_MICROPHONE_ON:
                 logger.info("🎤 Microphone enabled and will stay on by default for continuous conversation")
             else:
@@ -188,8 +187,8 @@ class GMeetAIAgent:
                 if self._should_ignore_audio():
                     continue
                 
-                # Check for speech activity
-                is_speaking, speech_started, speech_ended = self.vad.update_speech_state(audio_chunk)
+                # Check for speech activity (only the end of an utterance matters here)
+                _, _, speech_ended = self.vad.update_speech_state(audio_chunk)
                 
                 if speech_ended:
                     # Double-check we're not ignoring audio
@@ -273,7 +272,7 @@ class GMeetAIAgent:
         try:
             if self.meeting_controller and self.meeting_controller.meeting_active:
                 # Try to enable microphone, but continue even if it fails
-                success = self.meeting_controller.toggle_microphone(True)
+                success = await self.meeting_controller.atoggle_microphone(True)
                 if success:
                     logger.debug("🎤 Microphone enabled for speaking")
                 else:
@@ -288,12 +287,13 @@ class GMeetAIAgent:
             logger.info(f"🔊 Playing audio file directly: {audio_file}")
             
             # Use afplay on macOS to play audio directly to system output
-            result = subprocess.run(['afplay', audio_file], capture_output=True, text=True)
+            result = subprocess.run(['afplay', audio_file], check=False, stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 logger.info("✅ Audio played successfully using system audio")
             else:
-                logger.error(f"❌ Failed to play audio: {result.stderr}")
+                logger.error(f"❌ Failed to play audio (afplay exit code {result.returncode})")
                 
         except Exception as e:
             logger.error(f"❌ Error in audio fallback: {e}")
@@ -306,7 +306,7 @@ class GMeetAIAgent:
                 # Clear audio buffer to remove any queued audio
                 self.audio_capture.clear_buffer()
                 # Set a flag to ignore audio during TTS playback
-                self._ignore_audio_until = time.time() + 5.0  # Ignore for 5 seconds
+                self._ignore_audio_until = time.monotonic() + 5.0  # Ignore for 5 seconds
         except Exception as e:
             logger.warning(f"⚠️ Error pausing audio capture: {e}")
 
@@ -325,7 +325,7 @@ class GMeetAIAgent:
     def _should_ignore_audio(self) -> bool:
         """Check if we should ignore audio (during TTS playback)."""
         if hasattr(self, '_ignore_audio_until'):
-            return time.time() < self._ignore_audio_until
+            return time.monotonic() < self._ignore_audio_until
         return False
 
     async def _ensure_microphone_on(self):
@@ -337,18 +337,16 @@ class GMeetAIAgent:
                 
             if self.meeting_controller and self.meeting_controller.meeting_active:
                 # Check current microphone state
-                current_state = None
-                if self.meeting_controller.agent:
-                    current_state = self.meeting_controller.agent.is_microphone_enabled()
+                current_state = await self.meeting_controller.ais_microphone_enabled()
                 
                 if current_state is False:
                     # Microphone was turned off, turn it back on
                     logger.info("🎤 Microphone was off, turning back on for continuous conversation")
-                    self.meeting_controller.toggle_microphone(True)
+                    await self.meeting_controller.atoggle_microphone(True)
                 elif current_state is None:
                     # Can't determine state, ensure it's on
                     logger.debug("🎤 Ensuring microphone stays on")
-                    self.meeting_controller.toggle_microphone(True)
+                    await self.meeting_controller.atoggle_microphone(True)
                 # If current_state is True, microphone is already on, no action needed
                 
         except Exception as e:
@@ -457,4 +455,6 @@ async def main():
         print("✅ Agent stopped")
 
 if __name__ == "__main__":
+    if Config.LOG_SKIP_RECORD_EXTRAS:
+        skip_record_extras()
     asyncio.run(main()) 
\ No newline at end of file
@@ -107,7 +107,7 @@ def test_audio_capture():
     
     try:
         # Test with current config
-        capture = AudioCapture()
+        capture = AudioCapture(dtype="float32")  # Levels below assume float samples in [-1, 1]
         device_info = capture.get_device_info()
         
         print("Audio Capture Configuration:")
@@ -217,7 +217,7 @@ def test_real_time_detection():
     print_header("Real-Time Speech Detection Test")
     
     try:
-        capture = AudioCapture()
+        capture = AudioCapture(dtype="float32")  # Levels below assume float samples in [-1, 1]
         vad = VoiceActivityDetector()
         
         print("🎤 Starting 10-second real-time test...")
@@ -139,7 +139,8 @@ def test_audio_routing():
         import numpy as np
         
         print("🎙️ Recording 3 seconds from BlackHole...")
-        capture = AudioCapture(device=Config.AUDIO_DEVICE_INPUT, sample_rate=Config.SAMPLE_RATE)
+        capture = AudioCapture(device=Config.AUDIO_DEVICE_INPUT, sample_rate=Config.SAMPLE_RATE,
+                               dtype="float32")  # Thresholds below assume float samples
         
         if capture.start_recording():
             chunks = []
@@ -49,7 +49,8 @@ def test_blackhole_audio():
         print(f"🎤 Initializing audio capture from: {Config.AUDIO_DEVICE_INPUT}")
         capture = AudioCapture(
             device=Config.AUDIO_DEVICE_INPUT,
-            sample_rate=Config.SAMPLE_RATE
+            sample_rate=Config.SAMPLE_RATE,
+            dtype="float32"  # Thresholds below assume float samples in [-1, 1]
         )
         
         # Start recording
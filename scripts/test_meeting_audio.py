@@ -34,7 +34,7 @@ def test_meeting_audio():
     
     try:
         # Initialize audio capture
-        capture = AudioCapture()
+        capture = AudioCapture(dtype="float32")  # Levels below assume float samples in [-1, 1]
         vad = VoiceActivityDetector()
         
         print(f"📡 Listening on: {capture.device}")
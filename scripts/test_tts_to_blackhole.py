@@ -32,7 +32,7 @@ class TTSToBlackHoleTest:
     def __init__(self):
         self.config = Config()
         self.tts_client = TTSClient()  # TTS client gets config internally
-        self.audio_capture = AudioCapture()  # AudioCapture gets config internally
+        self.audio_capture = AudioCapture(dtype="float32")  # Float samples for the RMS volume check
         self.vad = VoiceActivityDetector()
         self.audio_playback = AudioPlayback()  # AudioPlayback gets config internally
         
@@ -10,10 +10,14 @@ from .whisper_client import WhisperClient
 from .gpt_client import GPTClient
 from .tts_client import TTSClient
 from .conversation_manager import ConversationManager
+from .transcript_cache import TranscriptCache
+from .tts_cache import TTSCache
 
 __all__ = [
     "WhisperClient",
     "GPTClient", 
     "TTSClient",
-    "ConversationManager"
+    "ConversationManager",
+    "TranscriptCache",
+    "TTSCache"
 ] 
\ No newline at end of file
@@ -14,6 +14,7 @@ from .whisper_client import WhisperClient
 from .gpt_client import GPTClient
 from .tts_client import TTSClient
 from ..utils.logger import setup_logger
+from ..utils.audio import float_to_int16, int_to_float, INT16_MAX
 
 logger = setup_logger("ai.conversation")
 
@@ -590,12 +591,7 @@ class ConversationManager:
                 audio_data = self._amplify_audio(audio_data)
             
             # Ensure audio data is in the right format
-            if audio_data.dtype != np.int16:
-                # Convert float to int16
-                if audio_data.dtype == np.float32 or audio_data.dtype == np.float64:
-                    audio_data = (audio_data * 32767).astype(np.int16)
-                else:
-                    audio_data = audio_data.astype(np.int16)
+            audio_data = float_to_int16(audio_data)
             
             # Write WAV file
             with wave.open(file_path, 'wb') as wav_file:
@@ -619,19 +615,24 @@ class ConversationManager:
             Amplified audio data
         """
         try:
-            # Calculate current RMS
+            if len(audio_data) == 0:
+                return audio_data
+            
+            # Calculate current RMS (int16 is measured without a float copy)
             if audio_data.dtype == np.int16:
-                audio_float = audio_data.astype(np.float32) / 32767.0
+                energy = np.einsum('i,i->', audio_data, audio_data, dtype=np.int64)
+                current_rms = np.sqrt(energy / len(audio_data)) / INT16_MAX
             else:
-                audio_float = audio_data.astype(np.float32)
-            
-            current_rms = np.sqrt(np.mean(audio_float ** 2))
+                audio_data = audio_data.astype(np.float32, copy=False)
+                current_rms = np.sqrt(np.mean(audio_data ** 2))
             
             if current_rms > 0.001:  # Only amplify if there's actual audio
                 # Calculate amplification factor
                 amplification = min(target_rms / current_rms, 10.0)  # Cap at 10x amplification
                 
                 if amplification > 1.5:  # Only amplify if significantly quiet
+                    # Convert to float only when the samples are actually rescaled
+                    audio_float = int_to_float(audio_data)
                     audio_float = audio_float * amplification
                     
                     # Prevent clipping
@@ -641,7 +642,7 @@ class ConversationManager:
                     
                     return audio_float
             
-            return audio_float
+            return audio_data
             
         except Exception as e:
             logger.warning(f"⚠️ Audio amplification failed: {e}")
@@ -0,0 +1,195 @@
+"""Persistent cache for Whisper transcription results keyed by audio content."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+import numpy as np
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+from ..utils.config import Config
+from ..utils.logger import setup_logger
+
+logger = setup_logger("ai.transcript_cache")
+
+def make_cache_key(pcm_data: np.ndarray,
+                   sample_rate: int,
+                   language: Optional[str],
+                   prompt: Optional[str],
+                   temperature: float,
+                   response_format: str = "json",
+                   model: str = "") -> bytes:
+    """Build a cache key from the uploaded PCM audio and request parameters.
+
+    Args:
+        pcm_data: int16 PCM audio exactly as it would be uploaded
+        sample_rate: Audio sample rate
+        language: Language code
+        prompt: Context prompt
+        temperature: Sampling temperature
+        response_format: Response format
+        model: Model or deployment name, so results from different models don't mix
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(pcm_data).tobytes())
+    params = f"{model}|{sample_rate}|{language or ''}|{prompt or ''}|{temperature}|{response_format}"
+    digest.update(params.encode("utf-8"))
+    return digest.digest()
+
+class TranscriptCache:
+    """Transcript store that survives process restarts.
+
+    Uses SQLite by default and Redis when a Redis URL is configured.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 redis_url: Optional[str] = None,
+                 ttl: Optional[int] = None,
+                 max_entries: Optional[int] = None):
+        """Initialize transcript cache.
+
+        Args:
+            path: SQLite database path (default from config)
+            redis_url: Redis connection URL (uses Redis backend when set)
+            ttl: Entry time-to-live in seconds (default from config)
+            max_entries: Maximum SQLite entries before oldest are evicted (default from config)
+        """
+        self.ttl = ttl or Config.TRANSCRIPT_CACHE_TTL
+        self.max_entries = max_entries or Config.TRANSCRIPT_CACHE_MAX_ENTRIES
+        redis_url = redis_url or Config.REDIS_URL
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+        self._redis = None
+        self._db: Optional[sqlite3.Connection] = None
+
+        if redis_url:
+            if redis is None:
+                raise ImportError("redis package is required for REDIS_URL. Install with: pip install redis")
+            self._redis = redis.Redis.from_url(redis_url)
+            self.backend = "redis"
+        else:
+            db_path = Path(path or Config.TRANSCRIPT_CACHE_PATH)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts ("
+                "key BLOB PRIMARY KEY, value BLOB, created INT, expires INT, hits INT DEFAULT 0)"
+            )
+            self._db.commit()
+            self.backend = "sqlite"
+
+        logger.info(f"🗄️  Transcript cache initialized ({self.backend})")
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Look up a cached transcription result.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Cached result dictionary or None on miss
+        """
+        try:
+            if self._redis is not None:
+                raw = self._redis.get(b"transcript:" + key)
+            else:
+                with self._lock:
+                    row = self._db.execute(
+                        "SELECT value FROM transcripts WHERE key = ? AND expires > ?",
+                        (key, int(time.time()))
+                    ).fetchone()
+                    if row is not None:
+                        self._db.execute("UPDATE transcripts SET hits = hits + 1 WHERE key = ?", (key,))
+                        self._db.commit()
+                raw = row[0] if row is not None else None
+            # A corrupt entry decodes with a ValueError and counts as a miss
+            value = json.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"⚠️  Transcript cache lookup failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a transcription result.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: JSON-serializable result dictionary
+            ttl: Time-to-live in seconds (default from cache)
+        """
+        ttl = ttl or self.ttl
+        try:
+            raw = json.dumps(value, default=str).encode("utf-8")
+            if self._redis is not None:
+                self._redis.setex(b"transcript:" + key, ttl, raw)
+                return
+
+            now = int(time.time())
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO transcripts (key, value, created, expires, hits) VALUES (?, ?, ?, ?, 0)",
+                    (key, raw, now, now + ttl)
+                )
+                self._puts_since_prune += 1
+                if self._puts_since_prune >= 100:
+                    self._prune(now)
+                self._db.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Transcript cache store failed: {e}")
+
+    def _prune(self, now: int) -> None:
+        """Drop expired entries and evict the oldest beyond max_entries (lock held)."""
+        self._puts_since_prune = 0
+        self._db.execute("DELETE FROM transcripts WHERE expires <= ?", (now,))
+        count = self._db.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+        if count > self.max_entries:
+            self._db.execute(
+                "DELETE FROM transcripts WHERE key IN "
+                "(SELECT key FROM transcripts ORDER BY created ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        """Close the backing store."""
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+                self._db = None
+        if self._redis is not None:
+            self._redis.close()
+            self._redis = None
@@ -0,0 +1,164 @@
+"""On-disk cache of synthesized speech keyed by voice settings and text."""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Optional, Iterable
+
+import numpy as np
+
+from ..utils.config import Config
+from ..utils.logger import setup_logger
+
+logger = setup_logger("ai.tts_cache")
+
+class TTSCache:
+    """Directory of WAV files holding previously synthesized utterances.
+
+    Files are touched on every hit; files unused for longer than ttl are
+    deleted, and the least recently used ones go once the directory grows
+    past max_bytes.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_bytes: Optional[int] = None,
+                 ttl: Optional[int] = None):
+        """Initialize TTS cache.
+
+        Args:
+            cache_dir: Directory for cached WAV files (default from config)
+            max_bytes: Total size before least recently used files are evicted (default from config)
+            ttl: Seconds a file may go unused before it is deleted (default from config)
+        """
+        self.cache_dir = Path(cache_dir or Config.TTS_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or Config.TTS_CACHE_MAX_MB * 1024 * 1024
+        self.ttl = ttl or Config.TTS_CACHE_TTL
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # Drop files that expired while the cache was not in use
+        self._evict()
+
+        logger.info(f"🗄️  TTS cache initialized ({self.cache_dir})")
+
+    def path_for(self, text: str, voice: str, model: str = "", speed: float = 1.0) -> Path:
+        """Get the cache file path for an utterance.
+
+        Args:
+            text: Text that is spoken
+            voice: Voice used for synthesis
+            model: TTS model used for synthesis
+            speed: Speech speed used for synthesis
+
+        Returns:
+            Path of the WAV file (which may not exist yet)
+        """
+        key = hashlib.sha1(f"{model}|{voice}|{speed}|{text}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{voice}-{key}.wav"
+
+    def get(self, path: Path) -> Optional[Path]:
+        """Look up a cached utterance.
+
+        Args:
+            path: Path from path_for()
+
+        Returns:
+            The path if it is cached and unexpired, else None
+        """
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                raise FileNotFoundError(path)
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return path
+
+    def put(self, path: Path, frames: Iterable[np.ndarray], sample_rate: int) -> None:
+        """Store an utterance as 16-bit mono WAV.
+
+        The file is written under a temporary name and renamed into place,
+        so concurrent readers never see a partial file.
+
+        Args:
+            path: Path from path_for()
+            frames: int16 PCM chunks in playback order
+            sample_rate: Audio sample rate
+        """
+        tmp_name = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(sample_rate)
+                for frame in frames:
+                    wav_file.writeframes(frame.astype("<i2", copy=False).tobytes())
+            os.replace(tmp_name, path)
+            tmp_name = None
+
+            self._evict()
+        except (OSError, wave.Error, ValueError) as e:
+            logger.warning(f"⚠️  TTS cache store failed: {e}")
+        finally:
+            # Only set if the file was not renamed into place
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _evict(self) -> None:
+        """Delete expired files, then least recently used ones until the cache fits in max_bytes."""
+        with self._lock:
+            expires = time.time() - self.ttl
+            entries = []
+            total = 0
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith(".wav"):
+                    stat = entry.stat()
+                    if stat.st_mtime < expires:
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            for _, size, file_path in sorted(entries):
+                try:
+                    os.unlink(file_path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def get_stats(self) -> dict:
+        """Get cache hit/miss statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        lookups = self.hits + self.misses
+        return {
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -3,11 +3,13 @@
 import io
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Literal, cast
+from typing import Optional, List, Literal, Iterator, cast
 import time
 import subprocess
 import os
 
+import numpy as np
+
 try:
     from openai import AzureOpenAI
 except ImportError:
@@ -21,6 +23,9 @@ logger = setup_logger("ai.tts")
 # Type alias for response formats
 ResponseFormat = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]
 
+# Raw "pcm" responses are 24kHz 16-bit signed little-endian mono
+PCM_SAMPLE_RATE = 24000
+
 class TTSClient:
     """Azure OpenAI TTS client for text-to-speech synthesis."""
     
@@ -147,7 +152,8 @@ class TTSClient:
                     '-c', '1'               # Mono
                 ]
                 
-                result = subprocess.run(convert_cmd, capture_output=True, text=True)
+                result = subprocess.run(convert_cmd, check=False, stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 if result.returncode == 0:
                     logger.info(f"✅ TTS audio converted using afconvert: {output_path}")
@@ -159,7 +165,8 @@ class TTSClient:
                         '-acodec', 'pcm_s16le', '-ar', '44100', '-ac', '1',
                         '-y', str(output_path)
                     ]
-                    result = subprocess.run(convert_cmd, capture_output=True, text=True)
+                    result = subprocess.run(convert_cmd, check=False, stdin=subprocess.DEVNULL,
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     
                     if result.returncode == 0:
                         logger.info(f"✅ TTS audio converted using ffmpeg: {output_path}")
@@ -227,6 +234,42 @@ class TTSClient:
             logger.error(f"❌ TTS synthesis to stream failed: {e}")
             return None
     
+    def stream_pcm(self,
+                   text: str,
+                   voice: Optional[str] = None,
+                   chunk_samples: int = 4800) -> Iterator[np.ndarray]:
+        """Synthesize text and yield raw PCM chunks as they arrive.
+        
+        Args:
+            text: Text to synthesize
+            voice: Voice to use (default: client voice)
+            chunk_samples: Samples per yielded chunk (at PCM_SAMPLE_RATE)
+            
+        Yields:
+            int16 numpy arrays of audio at PCM_SAMPLE_RATE
+        """
+        if not text.strip():
+            logger.warning("⚠️ Empty text provided for TTS")
+            return
+        
+        logger.info(f"🎵 Streaming speech: {text[:50]}...")
+        
+        with self.client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=voice or self.voice,
+            input=text,
+            response_format="pcm",
+            speed=self.speed
+        ) as response:
+            leftover = b""
+            for chunk in response.iter_bytes(chunk_size=chunk_samples * 2):
+                # Network chunks may split a sample; carry the odd byte over
+                data = leftover + chunk if leftover else chunk
+                usable = len(data) & ~1
+                leftover = data[usable:]
+                if usable:
+                    yield np.frombuffer(data[:usable], dtype="<i2")
+    
     def synthesize_text_chunks(self, 
                              text_chunks: list,
                              output_dir: Optional[str] = None) -> list:
@@ -14,6 +14,8 @@ except ImportError:
 
 from ..utils.config import Config
 from ..utils.logger import setup_logger
+from ..utils.audio import float_to_int16
+from .transcript_cache import TranscriptCache, make_cache_key
 
 logger = setup_logger("ai.whisper")
 
@@ -24,7 +26,8 @@ class WhisperClient:
                  azure_endpoint: Optional[str] = None,
                  api_key: Optional[str] = None,
                  api_version: Optional[str] = None,
-                 deployment_name: Optional[str] = None):
+                 deployment_name: Optional[str] = None,
+                 cache: Optional[TranscriptCache] = None):
         """Initialize Whisper client.
         
         Args:
@@ -32,6 +35,7 @@ class WhisperClient:
             api_key: Azure OpenAI API key
             api_version: API version to use
             deployment_name: Whisper deployment name
+            cache: Transcript cache (built from config if None and enabled)
         """
         if AzureOpenAI is None:
             raise ImportError("openai package is required. Install with: pip install openai")
@@ -53,6 +57,14 @@ class WhisperClient:
             api_version=self.api_version
         )
         
+        # Persistent transcript cache
+        self.cache = cache
+        if self.cache is None and Config.TRANSCRIPT_CACHE_ENABLED:
+            try:
+                self.cache = TranscriptCache()
+            except Exception as e:
+                logger.warning(f"⚠️  Transcript cache unavailable: {e}")
+        
         logger.info(f"🎤 Whisper client initialized (deployment: {self.deployment_name})")
     
     def transcribe_audio_file(self, 
@@ -154,6 +166,17 @@ class WhisperClient:
             Transcription result with text and metadata
         """
         try:
+            # Check the transcript cache before calling the API
+            cache_key = None
+            if self.cache is not None:
+                audio_data = float_to_int16(audio_data)
+                cache_key = make_cache_key(audio_data, sample_rate, language, prompt,
+                                           temperature, response_format, self.deployment_name)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"⚡ Transcript cache hit: {len(cached.get('text', ''))} characters")
+                    return cached
+            
             # Create temporary WAV file from audio data
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
                 temp_path = Path(temp_file.name)
@@ -170,6 +193,10 @@ class WhisperClient:
                     response_format=response_format,
                     temperature=temperature
                 )
+                
+                if cache_key is not None and "error" not in result:
+                    self.cache.put(cache_key, result)
+                
                 return result
             finally:
                 # Clean up temporary file
@@ -228,12 +255,7 @@ class WhisperClient:
         """
         try:
             # Ensure audio data is in the right format
-            if audio_data.dtype != np.int16:
-                # Convert float to int16
-                if audio_data.dtype == np.float32 or audio_data.dtype == np.float64:
-                    audio_data = (audio_data * 32767).astype(np.int16)
-                else:
-                    audio_data = audio_data.astype(np.int16)
+            audio_data = float_to_int16(audio_data)
             
             # Write WAV file
             with wave.open(str(file_path), 'wb') as wav_file:
@@ -301,4 +323,6 @@ class WhisperClient:
     async def close(self):
         """Close the client connection."""
         # Azure OpenAI client doesn't always need explicit closing
+        if self.cache is not None:
+            self.cache.close()
         logger.info("Whisper client closed")
\ No newline at end of file
@@ -3,5 +3,6 @@
 from .capture import AudioCapture
 from .playback import AudioPlayback  
 from .vad import VoiceActivityDetector
+from .ring_buffer import AudioRingBuffer
  
-__all__ = ['AudioCapture', 'AudioPlayback', 'VoiceActivityDetector'] 
\ No newline at end of file
+__all__ = ['AudioCapture', 'AudioPlayback', 'VoiceActivityDetector', 'AudioRingBuffer'] 
\ No newline at end of file
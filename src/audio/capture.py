@@ -5,13 +5,17 @@ import time
 import numpy as np
 import sounddevice as sd
 from typing import Callable, Optional, List
-from queue import Queue, Empty
 import tempfile
 import os
+import json
+import socket
+from pathlib import Path
 
 try:
     from ..utils.config import Config
     from ..utils.logger import setup_logger, log_audio_info
+    from ..utils.audio import float_to_int16
+    from .ring_buffer import AudioRingBuffer
 except ImportError:
     # Handle direct module execution
     import sys
@@ -19,28 +23,56 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.config import Config
     from utils.logger import setup_logger, log_audio_info
+    from utils.audio import float_to_int16
+    from audio.ring_buffer import AudioRingBuffer
 
 logger = setup_logger("audio.capture")
 
+# Stream callback messages can repeat on every block, so only they are throttled
+callback_logger = setup_logger("audio.capture.callback", throttle=1.0)
+callback_logger.propagate = False  # Has its own handler; don't log again through audio.capture
+
+# Candidate buffer sizes probed by the adaptive buffer-size warmup (smallest first)
+BUFFER_SIZE_CANDIDATES = (256, 512, 1024, 2048)
+# Maximum callback jitter (stddev) as a fraction of the buffer period
+MAX_JITTER_RATIO = 0.2
+# Seconds of callbacks recorded per candidate size
+JITTER_PROBE_DURATION = 1.0
+# Seconds of audio retained for readers before the oldest samples are dropped
+RING_BUFFER_SECONDS = 30.0
+
 class AudioCapture:
     """Handles audio capture from BlackHole input device."""
     
     def __init__(self, 
                  sample_rate: int = None,
                  buffer_size: int = None,
-                 device: Optional[str] = None):
+                 device: Optional[str] = None,
+                 auto_buffer_size: Optional[bool] = None,
+                 dtype: Optional[str] = None):
         """Initialize audio capture.
         
         Args:
             sample_rate: Audio sample rate (default from config)
             buffer_size: Buffer size for audio chunks (default from config)  
             device: Input device name (auto-detect BlackHole if None)
+            auto_buffer_size: Pick the smallest stable buffer size on first start (default from config)
+            dtype: Sample format of captured chunks, "int16" or "float32" (default from config)
         """
         self.sample_rate = sample_rate or Config.SAMPLE_RATE
         self.buffer_size = buffer_size or Config.BUFFER_SIZE
         self.device = device
+        self.auto_buffer_size = Config.AUTO_BUFFER_SIZE if auto_buffer_size is None else auto_buffer_size
+        self._buffer_size_tuned = False
+        self.dtype = np.dtype(dtype or Config.CAPTURE_DTYPE)
+        self.latency = self._parse_latency(Config.CAPTURE_LATENCY)
         
-        self.audio_queue = Queue()
+        # Preallocated ring written by the stream callback; the event wakes readers
+        self.audio_buffer = AudioRingBuffer(int(self.sample_rate * RING_BUFFER_SECONDS), dtype=self.dtype)
+        self._data_ready = threading.Event()
+        # Set once the stream delivers its first block (or recording stops)
+        self._stream_ready = threading.Event()
+        self._status_warned = False
         self.recording = False
         self.stream = None
         self._recording_thread = None
@@ -49,10 +81,21 @@ class AudioCapture:
         if not self.device:
             self.device = self._find_blackhole_device()
             
-        logger.info(f"🎤 Audio capture initialized")
-        logger.info(f"   Device: {self.device}")
-        logger.info(f"   Sample Rate: {self.sample_rate}Hz")
-        logger.info(f"   Buffer Size: {self.buffer_size}")
+        logger.info("🎤 Audio capture initialized\n"
+                    "   Device: %s\n"
+                    "   Sample Rate: %sHz\n"
+                    "   Buffer Size: %s\n"
+                    "   Sample Format: %s\n"
+                    "   Latency: %s",
+                    self.device, self.sample_rate, self.buffer_size, self.dtype, self.latency)
+    
+    @staticmethod
+    def _parse_latency(value: str):
+        """Turn a latency setting into a PortAudio latency (seconds or "low"/"high")."""
+        try:
+            return float(value)
+        except ValueError:
+            return value.lower()
     
     def _find_blackhole_device(self) -> Optional[str]:
         """Find BlackHole input device automatically."""
@@ -70,20 +113,128 @@ class AudioCapture:
         logger.warning("⚠️  BlackHole device not found, using default input")
         return None
     
+    def _find_device_index(self) -> Optional[int]:
+        """Resolve the configured device name to a PortAudio device index."""
+        if not self.device:
+            return None
+        
+        devices = sd.query_devices()
+        for i, device in enumerate(devices):
+            if isinstance(device, dict) and device.get('name') == self.device:
+                return i
+        return None
+    
+    def _measure_callback_jitter(self, device_index: Optional[int], blocksize: int) -> Optional[float]:
+        """Measure callback interval jitter for a candidate buffer size.
+        
+        Args:
+            device_index: PortAudio device index (None for default)
+            blocksize: Candidate buffer size in frames
+            
+        Returns:
+            Standard deviation of callback intervals in seconds, or None if
+            the stream reported xruns or produced too few callbacks
+        """
+        timestamps = []
+        statuses = []
+        
+        def probe_callback(indata, frames, time_info, status):
+            timestamps.append(time.perf_counter_ns())
+            if status:
+                statuses.append(status)
+        
+        try:
+            with sd.InputStream(device=device_index,
+                                channels=1,
+                                samplerate=self.sample_rate,
+                                blocksize=blocksize,
+                                latency=self.latency,
+                                callback=probe_callback,
+                                dtype=self.dtype):
+                time.sleep(JITTER_PROBE_DURATION)
+        except Exception as e:
+            logger.debug(f"Buffer size {blocksize} probe failed: {e}")
+            return None
+        
+        if statuses or len(timestamps) < 3:
+            return None
+        
+        intervals = np.diff(np.asarray(timestamps, dtype=np.int64)) / 1e9
+        return float(np.std(intervals))
+    
+    def _select_buffer_size(self, device_index: Optional[int]) -> int:
+        """Pick the smallest buffer size whose callback jitter stays in budget.
+        
+        The choice is cached on disk keyed by hostname, device and sample rate
+        so the warmup only runs once per machine/device combination.
+        
+        Args:
+            device_index: PortAudio device index (None for default)
+            
+        Returns:
+            Selected buffer size in frames
+        """
+        cache_file = Path(Config.CACHE_DIR) / "buffer_size.json"
+        cache_key = f"{socket.gethostname()}|{self.device or 'default'}|{self.sample_rate}"
+        
+        cache = {}
+        try:
+            if cache_file.exists():
+                cache = json.loads(cache_file.read_text())
+                if cache_key in cache:
+                    return int(cache[cache_key])
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable buffer size cache: {e}")
+            cache = {}
+        
+        logger.info("⏱️  Probing callback jitter to select buffer size...")
+        for blocksize in BUFFER_SIZE_CANDIDATES:
+            jitter = self._measure_callback_jitter(device_index, blocksize)
+            period = blocksize / self.sample_rate
+            if jitter is not None and jitter < MAX_JITTER_RATIO * period:
+                logger.debug(f"Buffer size {blocksize}: jitter {jitter * 1000:.2f}ms (period {period * 1000:.1f}ms)")
+                selected = blocksize
+                break
+        else:
+            # Don't cache the fallback: the device may just be busy or missing right now
+            logger.debug(f"No buffer size passed the jitter probe, using {self.buffer_size}")
+            return self.buffer_size
+        
+        try:
+            cache[cache_key] = selected
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(cache))
+        except OSError as e:
+            logger.debug(f"Could not write buffer size cache: {e}")
+        
+        return selected
+    
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for audio stream."""
         if status:
-            logger.warning(f"Audio callback status: {status}")
+            # Warn once per recording; repeats (e.g. an overflow on every block) go to debug
+            if self._status_warned:
+                callback_logger.debug("Audio callback status: %s", status)
+            else:
+                self._status_warned = True
+                callback_logger.warning("Audio callback status: %s", status)
         
         if self.recording:
             # Convert to mono if stereo
             if indata.shape[1] > 1:
-                audio_data = np.mean(indata, axis=1)
+                if indata.dtype == np.int16:
+                    # Sum in int32 so the channel sum cannot saturate
+                    audio_data = (indata.astype(np.int32).sum(axis=1) // indata.shape[1]).astype(np.int16)
+                else:
+                    audio_data = np.mean(indata, axis=1)
             else:
                 audio_data = indata[:, 0]
             
-            # Add to queue
-            self.audio_queue.put(audio_data.copy())
+            # Copy into the ring buffer (no per-callback allocation for mono input)
+            self.audio_buffer.write(audio_data)
+            self._data_ready.set()
+            if not self._stream_ready.is_set():
+                self._stream_ready.set()
     
     def start_recording(self) -> bool:
         """Start audio recording.
@@ -97,22 +248,25 @@ class AudioCapture:
         
         try:
             # Find device index
-            device_index = None
-            if self.device:
-                devices = sd.query_devices()
-                for i, device in enumerate(devices):
-                    if isinstance(device, dict) and device.get('name') == self.device:
-                        device_index = i
-                        break
+            device_index = self._find_device_index()
+            
+            # One-time buffer size tuning for this device
+            if self.auto_buffer_size and not self._buffer_size_tuned:
+                self.buffer_size = self._select_buffer_size(device_index)
+                self._buffer_size_tuned = True
+                logger.info(f"   Buffer Size: {self.buffer_size} (auto)")
             
             # Start audio stream
+            self._stream_ready.clear()
+            self._status_warned = False
             self.stream = sd.InputStream(
                 device=device_index,
                 channels=1,
                 samplerate=self.sample_rate,
                 blocksize=self.buffer_size,
+                latency=self.latency,
                 callback=self._audio_callback,
-                dtype=np.float32
+                dtype=self.dtype
             )
             
             self.stream.start()
@@ -131,6 +285,9 @@ class AudioCapture:
             return
         
         self.recording = False
+        # Wake readers blocked on new data so they see the stop immediately
+        self._data_ready.set()
+        self._stream_ready.set()
         
         if self.stream:
             self.stream.stop()
@@ -139,19 +296,56 @@ class AudioCapture:
         
         logger.info("🛑 Audio recording stopped")
     
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the stream has delivered its first block of audio.
+        
+        Args:
+            timeout: Timeout in seconds (wait indefinitely if None)
+            
+        Returns:
+            True if audio is flowing, False on timeout or if recording stopped
+        """
+        return self._stream_ready.wait(timeout) and self.recording
+    
     def get_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
-        """Get the next audio chunk from the queue.
+        """Get all audio captured since the last read.
         
         Args:
             timeout: Timeout in seconds
             
         Returns:
-            Audio data as numpy array or None if timeout
+            Audio data as numpy array or None if timeout or recording stopped
         """
-        try:
-            return self.audio_queue.get(timeout=timeout)
-        except Empty:
-            return None
+        if not self.audio_buffer.available():
+            if not self.recording:
+                return None
+            self._data_ready.clear()
+            # Re-check after clearing so a write (or stop) in between is not missed
+            if not self.audio_buffer.available() and self.recording and not self._data_ready.wait(timeout):
+                return None
+        
+        chunk = self.audio_buffer.read()
+        return chunk if len(chunk) else None
+    
+    def get_audio_chunk_into(self, out: np.ndarray, timeout: float = 1.0) -> int:
+        """Copy audio captured since the last read into a caller-owned buffer.
+        
+        Args:
+            out: Destination array; up to len(out) samples are written to out[:n]
+            timeout: Timeout in seconds
+            
+        Returns:
+            Number of samples copied (0 on timeout or recording stopped)
+        """
+        if not self.audio_buffer.available():
+            if not self.recording:
+                return 0
+            self._data_ready.clear()
+            # Re-check after clearing so a write (or stop) in between is not missed
+            if not self.audio_buffer.available() and self.recording and not self._data_ready.wait(timeout):
+                return 0
+        
+        return self.audio_buffer.read_into(out)
     
     def get_audio_buffer(self, duration: float) -> Optional[np.ndarray]:
         """Get audio buffer for specified duration.
@@ -167,11 +361,11 @@ class AudioCapture:
             return None
         
         chunks = []
-        start_time = time.time()
+        deadline = time.monotonic() + duration * 2
         expected_samples = int(duration * self.sample_rate)
         collected_samples = 0
         
-        while collected_samples < expected_samples and (time.time() - start_time) < duration * 2:
+        while collected_samples < expected_samples and time.monotonic() < deadline:
             chunk = self.get_audio_chunk(timeout=0.1)
             if chunk is not None:
                 chunks.append(chunk)
@@ -187,9 +381,14 @@ class AudioCapture:
         if len(audio_buffer) > expected_samples:
             audio_buffer = audio_buffer[:expected_samples]
         
-        logger.debug(f"Collected audio buffer: {len(audio_buffer)} samples ({len(audio_buffer)/self.sample_rate:.2f}s)")
+        logger.debug("Collected audio buffer: %d samples (%.2fs)", len(audio_buffer), len(audio_buffer) / self.sample_rate)
         return audio_buffer
     
+    def default_wav_path(self) -> str:
+        """Get an auto-generated path for a captured WAV file."""
+        timestamp = int(time.time())
+        return f"/tmp/gmeet_audio_{timestamp}.wav"
+    
     def save_audio_to_wav(self, audio_data: np.ndarray, filename: Optional[str] = None) -> str:
         """Save audio data to WAV file.
         
@@ -201,13 +400,10 @@ class AudioCapture:
             Path to saved file
         """
         if filename is None:
-            timestamp = int(time.time())
-            filename = f"/tmp/gmeet_audio_{timestamp}.wav"
+            filename = self.default_wav_path()
         
         # Ensure audio is in correct format
-        if audio_data.dtype != np.int16:
-            # Convert from float32 to int16
-            audio_data = (audio_data * 32767).astype(np.int16)
+        audio_data = float_to_int16(audio_data)
         
         # Use scipy to write WAV file
         from scipy.io.wavfile import write
@@ -224,21 +420,27 @@ class AudioCapture:
                     'device': self.device,
                     'sample_rate': self.sample_rate,
                     'buffer_size': self.buffer_size,
+                    'dtype': str(self.dtype),
                     'recording': self.recording,
-                    'queue_size': self.audio_queue.qsize()
+                    'buffered_samples': self.audio_buffer.available(),
+                    'overruns': self.audio_buffer.overruns
                 }
         except Exception as e:
             logger.error(f"Error getting device info: {e}")
         
         return {}
     
+    def trim_buffer(self, keep_seconds: float) -> None:
+        """Drop buffered audio older than keep_seconds.
+        
+        Args:
+            keep_seconds: Seconds of the most recent audio to keep
+        """
+        self.audio_buffer.keep_last(int(keep_seconds * self.sample_rate))
+    
     def clear_buffer(self) -> None:
-        """Clear the audio buffer queue."""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except Empty:
-                break
+        """Clear the audio buffer."""
+        self.audio_buffer.clear()
         logger.debug("Audio buffer cleared")
     
     def __enter__(self):
@@ -4,14 +4,17 @@ import sounddevice as sd
 import numpy as np
 import threading
 import time
-from typing import Optional, Union
+from collections import deque
+from typing import Optional, Union, Tuple, Dict
 from pathlib import Path
 import tempfile
 import os
+from math import gcd
 
 try:
     from ..utils.config import Config
     from ..utils.logger import setup_logger, log_audio_info
+    from ..utils.audio import float_to_int16, int_to_float
 except ImportError:
     # Handle direct module execution
     import sys
@@ -19,93 +22,237 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.config import Config
     from utils.logger import setup_logger, log_audio_info
+    from utils.audio import float_to_int16, int_to_float
 
 logger = setup_logger("audio.playback")
 
+# Stream callback messages can repeat on every block, so only they are throttled
+callback_logger = setup_logger("audio.playback.callback", throttle=1.0)
+callback_logger.propagate = False  # Has its own handler; don't log again through audio.playback
+
+# Frames per PortAudio callback for the persistent output stream
+OUTPUT_BLOCKSIZE = 1024
+
+# Above this up*down product the polyphase filter gets too long and FFT resampling is used
+_MAX_RESAMPLE_POLY_PRODUCT = 1_000_000
+
+class _StreamResampler:
+    """Polyphase resampler that carries filter history across chunks.
+    
+    Resampling each chunk on its own restarts the FIR from silence at every
+    boundary (audible clicks) and rounds the output length per chunk (drift).
+    This keeps enough trailing input to continue the filter and tracks the
+    output phase globally, so the concatenated output matches resampling the
+    whole stream at once, delayed by half the filter length.
+    """
+    
+    def __init__(self, original_rate: int, target_rate: int):
+        from scipy import signal
+        
+        self.original_rate = int(original_rate)
+        g = gcd(int(target_rate), self.original_rate)
+        self.up, self.down = int(target_rate) // g, self.original_rate // g
+        
+        # Same anti-aliasing filter resample_poly designs by default
+        max_rate = max(self.up, self.down)
+        half_len = 10 * max_rate
+        self._taps = (signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+                      * self.up).astype(np.float32)
+        self._upfirdn = signal.upfirdn
+        
+        # Input samples of history needed to cover the filter length
+        self._history_len = -(-len(self._taps) // self.up)
+        self._history: Optional[np.ndarray] = None
+        self._consumed = 0     # Input samples before the start of _history
+        self._next_out = 0     # Upsampled index of the next output sample
+    
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of the stream (float32 in, float32 out)."""
+        data = chunk if self._history is None else np.concatenate((self._history, chunk))
+        start = self._consumed * self.up
+        end = (self._consumed + len(data)) * self.up
+        
+        # Emit every output whose inputs have all arrived; _next_out and start
+        # are multiples of down, so the filter's output grid lines up
+        filtered = self._upfirdn(self._taps, data, self.up, self.down, axis=0)
+        first = (self._next_out - start) // self.down
+        last = -(-(end - start) // self.down)
+        out = filtered[first:last]
+        self._next_out += len(out) * self.down
+        
+        # Keep at least the filter length of input, starting on a multiple of down
+        total = self._consumed + len(data)
+        keep_from = total - self._history_len
+        keep_from -= keep_from % self.down
+        keep_from = max(keep_from, self._consumed)
+        self._history = data[keep_from - self._consumed:]
+        self._consumed = keep_from
+        return out
+
 class AudioPlayback:
     """Handles audio playback to BlackHole output device for Google Meet microphone injection."""
     
     def __init__(self, 
                  sample_rate: int = None,
-                 device: Optional[str] = None):
+                 device: Optional[str] = None,
+                 dtype: Optional[str] = None):
         """Initialize audio playback.
         
         Args:
             sample_rate: Audio sample rate (default from config)
             device: Output device name (auto-detect BlackHole if None)
+            dtype: Output stream sample format, "int16" or "float32" (default from config)
         """
         self.sample_rate = sample_rate or Config.SAMPLE_RATE
         self.device = device
+        self.dtype = np.dtype(dtype or Config.PLAYBACK_DTYPE)
         self.playing = False
         
-        # Auto-detect BlackHole device
-        if not self.device:
-            self.device = self._find_blackhole_output_device()
+        # Test tones keyed by (sample_rate, frequency, duration)
+        self._tone_cache: Dict[Tuple[int, float, float], np.ndarray] = {}
+        
+        # Queued utterances consumed by the output stream callback
+        self._ring: deque = deque()
+        self._current: Optional[np.ndarray] = None
+        self._current_pos = 0
+        self._flush = False
+        self._stream: Optional[sd.OutputStream] = None
+        
+        # Set whenever the queue is drained (nothing left to play); the lock
+        # makes the callback's drained check and _enqueue's append atomic
+        self._done = threading.Event()
+        self._done.set()
+        self._state_lock = threading.Lock()
+        
+        # Resampler state for the current write_pcm_frame() stream
+        self._pcm_resampler: Optional[_StreamResampler] = None
+        
+        # Resolve the output device once; refresh_devices() re-queries PortAudio
+        self._device_index: Optional[int] = None
+        self.refresh_devices()
             
-        logger.info(f"🔊 Audio playback initialized")
-        logger.info(f"   Device: {self.device}")
-        logger.info(f"   Sample Rate: {self.sample_rate}Hz")
+        logger.info("🔊 Audio playback initialized\n"
+                    "   Device: %s\n"
+                    "   Sample Rate: %sHz\n"
+                    "   Sample Format: %s",
+                    self.device, self.sample_rate, self.dtype)
     
-    def _find_blackhole_output_device(self) -> Optional[str]:
-        """Find BlackHole output device automatically."""
+    def _find_blackhole_output_device(self) -> Tuple[Optional[str], Optional[int]]:
+        """Find BlackHole output device automatically.
+        
+        Returns:
+            Tuple of (device_name, device_index), or (None, None) if not found
+        """
         try:
             devices = sd.query_devices()
-            for device in devices:
+            for i, device in enumerate(devices):
                 if isinstance(device, dict) and 'BlackHole' in device.get('name', ''):
                     if device.get('max_output_channels', 0) > 0:
                         logger.info(f"🔍 Found BlackHole output device: {device['name']}")
                         log_audio_info(logger, device)
-                        return device['name']
+                        return device['name'], i
         except Exception as e:
             logger.error(f"Error finding BlackHole output device: {e}")
         
         logger.warning("⚠️  BlackHole output device not found, using default output")
+        return None, None
+    
+    def _find_device_index(self, device_name: str) -> Optional[int]:
+        """Look up the PortAudio index of an output device by name."""
+        try:
+            devices = sd.query_devices()
+            for i, device in enumerate(devices):
+                if isinstance(device, dict) and device.get('name') == device_name:
+                    return i
+        except Exception as e:
+            logger.error(f"Error looking up output device '{device_name}': {e}")
         return None
     
-    def play_audio_data(self, audio_data: np.ndarray, blocking: bool = True) -> bool:
+    def refresh_devices(self) -> None:
+        """Re-resolve the output device index (e.g. after devices change)."""
+        if self.device:
+            self._device_index = self._find_device_index(self.device)
+        else:
+            # Auto-detect BlackHole device
+            self.device, self._device_index = self._find_blackhole_output_device()
+        
+        self._open_stream()
+    
+    def _open_stream(self) -> None:
+        """(Re)open the long-lived stereo output stream on the resolved device."""
+        self.close()
+        try:
+            self._stream = sd.OutputStream(samplerate=self.sample_rate,
+                                           channels=2,
+                                           dtype=self.dtype.name,
+                                           device=self._device_index,
+                                           blocksize=OUTPUT_BLOCKSIZE,
+                                           callback=self._callback)
+            self._stream.start()
+        except Exception as e:
+            logger.error(f"Failed to open output stream: {e}")
+            self._stream = None
+    
+    def _callback(self, outdata, frames, time_info, status):
+        """Output stream callback: drain queued audio into the device buffer."""
+        if status:
+            callback_logger.debug("Output status: %s", status)
+        
+        if self._flush:
+            self._flush = False
+            self._current = None
+        
+        filled = 0
+        while filled < frames:
+            if self._current is None:
+                try:
+                    self._current = self._ring.popleft()
+                except IndexError:
+                    break
+                self._current_pos = 0
+            
+            n = min(frames - filled, len(self._current) - self._current_pos)
+            outdata[filled:filled + n] = self._current[self._current_pos:self._current_pos + n]
+            filled += n
+            self._current_pos += n
+            
+            if self._current_pos >= len(self._current):
+                self._current = None
+        
+        if filled < frames:
+            outdata[filled:] = 0
+            if self._current is None and not self._ring:
+                with self._state_lock:
+                    # Re-check under the lock: _enqueue may have appended since
+                    if not self._ring:
+                        self.playing = False
+                        self._done.set()
+    
+    def play_audio_data(self, audio_data: np.ndarray, blocking: bool = False,
+                        assume_ready: bool = False) -> bool:
         """Play audio data directly.
         
+        Audio is queued on the persistent output stream, so consecutive
+        calls play back-to-back without reopening the device.
+        
         Args:
             audio_data: Audio data as numpy array
             blocking: If True, wait for playback to complete
+            assume_ready: Skip format conversion; audio_data must already be
+                in the stream's sample format (see prepare_audio())
             
         Returns:
             True if playback started successfully
         """
         try:
-            # Find device index
-            device_index = None
-            if self.device:
-                devices = sd.query_devices()
-                for i, device in enumerate(devices):
-                    if isinstance(device, dict) and device.get('name') == self.device:
-                        device_index = i
-                        break
-            
-            # Ensure audio is in correct format
-            if audio_data.dtype != np.float32:
-                if audio_data.dtype == np.int16:
-                    audio_data = audio_data.astype(np.float32) / 32767.0
-                else:
-                    audio_data = audio_data.astype(np.float32)
-            
-            # Ensure audio is mono -> stereo for output
-            if len(audio_data.shape) == 1:
-                # Convert mono to stereo
-                audio_data = np.column_stack((audio_data, audio_data))
-            
-            self.playing = True
-            
-            # Play audio
-            sd.play(audio_data, 
-                   samplerate=self.sample_rate, 
-                   device=device_index,
-                   blocking=blocking)
+            if not self._enqueue(audio_data, assume_ready):
+                return False
             
-            logger.info(f"🎵 Playing audio: {len(audio_data)} samples ({len(audio_data)/self.sample_rate:.2f}s)")
+            duration = len(audio_data) / self.sample_rate
+            logger.info("🎵 Playing audio: %d samples (%.2fs)", len(audio_data), duration)
             
             if blocking:
-                self.playing = False
+                self.wait_for_playback_complete(timeout=duration + 5.0)
             
             return True
             
@@ -114,6 +261,78 @@ class AudioPlayback:
             self.playing = False
             return False
     
+    def write_pcm_frame(self, frame: np.ndarray, sample_rate: Optional[int] = None) -> bool:
+        """Append a chunk of streamed audio to the playback queue without blocking.
+        
+        Intended for producers (e.g. streaming TTS) that deliver audio
+        incrementally; playback starts with the first chunk. Chunks at a
+        different rate are resampled as one continuous stream; call
+        reset_pcm_stream() before starting an unrelated stream.
+        
+        Args:
+            frame: Mono or stereo audio chunk
+            sample_rate: Sample rate of the chunk (default: playback rate)
+            
+        Returns:
+            True if the chunk was queued
+        """
+        try:
+            if sample_rate and sample_rate != self.sample_rate:
+                resampler = self._pcm_resampler
+                if resampler is None or resampler.original_rate != sample_rate:
+                    resampler = self._pcm_resampler = _StreamResampler(sample_rate, self.sample_rate)
+                frame = resampler.process(int_to_float(frame))
+                if not len(frame):
+                    return True
+            return self._enqueue(frame)
+        except Exception as e:
+            logger.error(f"Failed to queue audio frame: {e}")
+            return False
+    
+    def reset_pcm_stream(self) -> None:
+        """Forget resampler history so the next write_pcm_frame() starts a new stream."""
+        self._pcm_resampler = None
+    
+    def _enqueue(self, audio_data: np.ndarray, assume_ready: bool = False) -> bool:
+        """Convert audio to the stream format and queue it for the output callback."""
+        if self._stream is None:
+            self._open_stream()
+            if self._stream is None:
+                return False
+        
+        # Ensure audio is in correct format
+        if not assume_ready:
+            audio_data = self._to_output_dtype(audio_data)
+        
+        # Ensure audio is mono -> stereo for output
+        if len(audio_data.shape) == 1:
+            # Convert mono to stereo as a zero-copy broadcast view
+            # (both channels share the mono buffer; sounddevice only reads it)
+            audio_data = np.broadcast_to(audio_data[:, None], (audio_data.shape[0], 2))
+        
+        # Queue audio for the output stream callback
+        with self._state_lock:
+            self._ring.append(audio_data)
+            self._done.clear()
+            self.playing = True
+        return True
+    
+    def prepare_audio(self, audio_data: np.ndarray) -> np.ndarray:
+        """Return audio as a contiguous array in the stream's sample format.
+        
+        Arrays that already match are returned as-is, so the result can be
+        passed to play_audio_data(..., assume_ready=True) without a copy.
+        """
+        return np.ascontiguousarray(self._to_output_dtype(audio_data))
+    
+    def _to_output_dtype(self, audio_data: np.ndarray) -> np.ndarray:
+        """Convert audio to the stream's sample format (no-op if it already matches)."""
+        if self.dtype == np.int16:
+            if audio_data.dtype == np.int32:
+                audio_data = int_to_float(audio_data)
+            return float_to_int16(audio_data)
+        return int_to_float(audio_data)
+    
     def play_audio_file(self, file_path: Union[str, Path], blocking: bool = True) -> bool:
         """Play audio from file.
         
@@ -149,35 +368,61 @@ class AudioPlayback:
             logger.error(f"Failed to play audio file {file_path}: {e}")
             return False
     
+    def _load_with_soundfile(self, file_path: Path) -> tuple:
+        """Decode straight to the output sample format with libsndfile.
+        
+        Returns:
+            (audio_data, sample_rate), or (None, None) if soundfile is
+            unavailable or cannot decode the file
+        """
+        try:
+            import soundfile as sf
+        except ImportError:
+            return None, None
+        
+        try:
+            audio_data, sample_rate = sf.read(str(file_path), dtype=self.dtype.name, always_2d=False)
+            return audio_data, sample_rate
+        except Exception as e:
+            logger.debug(f"soundfile could not decode {file_path}: {e}")
+            return None, None
+    
     def _load_wav_file(self, file_path: Path) -> tuple:
-        """Load WAV file using scipy."""
+        """Load WAV file using soundfile, falling back to scipy."""
+        audio_data, sample_rate = self._load_with_soundfile(file_path)
+        if audio_data is not None:
+            return audio_data, sample_rate
+        
         from scipy.io.wavfile import read
         sample_rate, audio_data = read(file_path)
         
-        # Convert to float32
-        if audio_data.dtype == np.int16:
-            audio_data = audio_data.astype(np.float32) / 32767.0
-        elif audio_data.dtype == np.int32:
-            audio_data = audio_data.astype(np.float32) / 2147483647.0
+        # int16 files play as-is on an int16 stream; everything else goes via float32
+        if audio_data.dtype != self.dtype and audio_data.dtype in (np.int16, np.int32):
+            audio_data = int_to_float(audio_data)
         
         return audio_data, sample_rate
     
     def _load_mp3_file(self, file_path: Path) -> tuple:
-        """Load MP3 file using pydub."""
+        """Load MP3 file using soundfile (libsndfile >= 1.1), falling back to pydub."""
+        audio_data, sample_rate = self._load_with_soundfile(file_path)
+        if audio_data is not None:
+            return audio_data, sample_rate
+        
         try:
             from pydub import AudioSegment
             
             # Load MP3
             audio = AudioSegment.from_mp3(str(file_path))
             
-            # Convert to numpy array
-            audio_data = np.array(audio.get_array_of_samples(), dtype=np.float32)
-            
-            # Normalize
+            # Convert to numpy array and normalize in one pass
             if audio.sample_width == 2:  # 16-bit
-                audio_data = audio_data / 32767.0
+                audio_data = np.frombuffer(audio.raw_data, dtype=np.int16)
+                if self.dtype != np.int16:
+                    audio_data = int_to_float(audio_data)
             elif audio.sample_width == 4:  # 32-bit
-                audio_data = audio_data / 2147483647.0
+                audio_data = int_to_float(np.frombuffer(audio.raw_data, dtype=np.int32))
+            else:
+                audio_data = np.array(audio.get_array_of_samples(), dtype=np.float32)
             
             # Handle stereo
             if audio.channels == 2:
@@ -196,23 +441,24 @@ class AudioPlayback:
         try:
             from scipy import signal
             
-            # Calculate resampling ratio
-            ratio = target_rate / original_rate
+            # Filter in float so integer PCM is not misread as full-scale floats
+            audio_data = int_to_float(audio_data)
             
-            # Resample
-            if len(audio_data.shape) == 1:
-                # Mono
-                resampled = signal.resample(audio_data, 
-                                          int(len(audio_data) * ratio))
+            # Reduce the rate ratio to integer up/down factors
+            g = gcd(int(target_rate), int(original_rate))
+            up, down = int(target_rate) // g, int(original_rate) // g
+            
+            # Resample (mono and multi-channel alike along the sample axis)
+            if up * down <= _MAX_RESAMPLE_POLY_PRODUCT:
+                # Polyphase FIR: O(N * taps) and free of FFT-size pathologies
+                resampled = signal.resample_poly(audio_data, up, down, axis=0)
             else:
-                # Stereo - resample each channel
-                resampled = np.column_stack([
-                    signal.resample(audio_data[:, 0], int(len(audio_data) * ratio)),
-                    signal.resample(audio_data[:, 1], int(len(audio_data) * ratio))
-                ])
+                ratio = target_rate / original_rate
+                resampled = signal.resample(audio_data, int(len(audio_data) * ratio), axis=0)
             
-            logger.debug(f"Resampled audio from {original_rate}Hz to {target_rate}Hz")
-            return resampled.astype(np.float32)
+            logger.debug("Resampled audio from %sHz to %sHz", original_rate, target_rate)
+            # resample_poly keeps float32 input as float32; only the FFT path upcasts
+            return resampled.astype(np.float32, copy=False)
             
         except Exception as e:
             logger.error(f"Failed to resample audio: {e}")
@@ -229,15 +475,19 @@ class AudioPlayback:
             True if TTS and playback successful
         """
         # This will be implemented when we add the TTS module
-        logger.info(f"🗣️  TTS Playback requested: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+        logger.info("🗣️  TTS Playback requested: '%s%s'", text[:50], '...' if len(text) > 50 else '')
         logger.warning("TTS integration not yet implemented - this is a placeholder")
         return False
     
     def stop_playback(self) -> None:
         """Stop current audio playback."""
         try:
-            sd.stop()
-            self.playing = False
+            with self._state_lock:
+                self._ring.clear()
+                self._flush = True
+                self.playing = False
+                self._done.set()
+            self._pcm_resampler = None
             logger.info("🛑 Audio playback stopped")
         except Exception as e:
             logger.error(f"Error stopping playback: {e}")
@@ -251,11 +501,17 @@ class AudioPlayback:
         Returns:
             True if playback completed, False if timeout
         """
-        start_time = time.time()
-        while self.playing and (time.time() - start_time) < timeout:
-            time.sleep(0.1)
-        
-        return not self.playing
+        return self._done.wait(timeout)
+    
+    def close(self) -> None:
+        """Stop and close the output stream."""
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as e:
+                logger.error(f"Error closing output stream: {e}")
+            self._stream = None
     
     def get_device_info(self) -> dict:
         """Get information about the current audio output device."""
@@ -263,6 +519,7 @@ class AudioPlayback:
             return {
                 'device': self.device,
                 'sample_rate': self.sample_rate,
+                'dtype': str(self.dtype),
                 'playing': self.playing
             }
         except Exception as e:
@@ -280,11 +537,18 @@ class AudioPlayback:
             True if test successful
         """
         try:
-            # Generate sine wave
-            t = np.linspace(0, duration, int(self.sample_rate * duration), False)
-            tone = np.sin(2 * np.pi * frequency * t) * 0.3  # 30% volume
+            key = (self.sample_rate, frequency, duration)
+            tone = self._tone_cache.get(key)
+            if tone is None:
+                # Generate sine wave in place on a single float32 buffer
+                tone = np.arange(int(self.sample_rate * duration), dtype=np.float32)
+                np.multiply(tone, np.float32(2 * np.pi * frequency / self.sample_rate), out=tone)
+                np.sin(tone, out=tone)
+                np.multiply(tone, np.float32(0.3), out=tone)  # 30% volume
+                tone = self._to_output_dtype(tone)
+                self._tone_cache[key] = tone
             
-            logger.info(f"🎵 Testing playback with {frequency}Hz tone for {duration}s")
+            logger.info("🎵 Testing playback with %sHz tone for %ss", frequency, duration)
             return self.play_audio_data(tone, blocking=True)
             
         except Exception as e:
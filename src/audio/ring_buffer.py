@@ -0,0 +1,105 @@
+"""Preallocated single-producer/single-consumer ring buffer for audio samples."""
+
+import numpy as np
+from typing import Optional
+
+class AudioRingBuffer:
+    """Fixed-size sample ring written by the audio callback and drained by one reader.
+
+    The writer copies into preallocated storage and publishes by advancing
+    its position last, so the callback path takes no locks and allocates
+    nothing. When the reader falls more than one capacity behind, the oldest
+    samples are dropped (bounded window) and counted as an overrun.
+    """
+
+    def __init__(self, capacity: int, dtype=np.float32):
+        """Initialize ring buffer.
+
+        Args:
+            capacity: Number of samples retained
+            dtype: Sample dtype
+        """
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._buffer = np.zeros(self.capacity, dtype=self.dtype)
+
+        # Monotonic totals; positions in the buffer are taken modulo capacity
+        self._write_pos = 0
+        self._read_pos = 0
+        self.overruns = 0
+
+    def write(self, data: np.ndarray) -> None:
+        """Append samples (producer side, safe to call from the audio callback).
+
+        Args:
+            data: 1-D array of samples
+        """
+        n = len(data)
+        if n > self.capacity:
+            data = data[-self.capacity:]
+            n = self.capacity
+
+        start = self._write_pos % self.capacity
+        first = min(n, self.capacity - start)
+        self._buffer[start:start + first] = data[:first]
+        if first < n:
+            self._buffer[:n - first] = data[first:]
+
+        # Publish after the copy so the reader never sees unwritten samples
+        self._write_pos += n
+
+    def available(self) -> int:
+        """Number of samples ready to be read."""
+        return min(self._write_pos - self._read_pos, self.capacity)
+
+    def read(self, max_samples: Optional[int] = None) -> np.ndarray:
+        """Take up to max_samples of the oldest unread samples (consumer side).
+
+        Args:
+            max_samples: Maximum samples to return (all available if None)
+
+        Returns:
+            Newly allocated array of samples (empty if nothing is available)
+        """
+        n = self.available()
+        if max_samples is not None:
+            n = min(n, max_samples)
+
+        result = np.empty(n, dtype=self.dtype)
+        return result[:self.read_into(result)]
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy up to len(out) of the oldest unread samples into out (consumer side).
+
+        Args:
+            out: Destination array; samples are written to out[:n]
+
+        Returns:
+            Number of samples copied
+        """
+        write_pos = self._write_pos
+        read_pos = self._read_pos
+
+        if write_pos - read_pos > self.capacity:
+            # Reader fell behind; skip the samples that were overwritten
+            self.overruns += 1
+            read_pos = write_pos - self.capacity
+
+        n = min(write_pos - read_pos, len(out))
+
+        start = read_pos % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        if first < n:
+            out[first:n] = self._buffer[:n - first]
+
+        self._read_pos = read_pos + n
+        return n
+
+    def keep_last(self, n: int) -> None:
+        """Discard unread samples except the most recent n."""
+        self._read_pos = max(self._read_pos, self._write_pos - int(n))
+
+    def clear(self) -> None:
+        """Discard all unread samples."""
+        self._read_pos = self._write_pos
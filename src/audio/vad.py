@@ -5,9 +5,15 @@ import numpy as np
 from typing import List, Tuple, Optional
 import struct
 
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
 try:
     from ..utils.config import Config
     from ..utils.logger import setup_logger
+    from ..utils.audio import float_to_int16, int_to_float, INT16_MAX, INT16_MIN
 except ImportError:
     # Handle direct module execution
     import sys
@@ -15,9 +21,19 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.config import Config
     from utils.logger import setup_logger
+    from utils.audio import float_to_int16, int_to_float, INT16_MAX, INT16_MIN
 
 logger = setup_logger("audio.vad")
 
+# Silero VAD window size (samples) per supported sample rate
+SILERO_WINDOW_SIZES = {8000: 256, 16000: 512}
+# Trailing samples of the previous window that Silero v5 expects before each window
+SILERO_CONTEXT_SIZES = {8000: 32, 16000: 64}
+
+# Frames quieter than this RMS (in int16 units, about -70 dBFS) are treated as
+# silence without calling into WebRTC VAD
+SILENCE_RMS_FLOOR = 10.0
+
 class VoiceActivityDetector:
     """Detects voice activity in audio streams using WebRTC VAD."""
     
@@ -49,20 +65,132 @@ class VoiceActivityDetector:
         self.vad = webrtcvad.Vad()
         self.vad.set_mode(self.aggressiveness)
         
+        # Optional Silero VAD (ONNX); its recurrent state carries across windows and calls
+        self._silero = None
+        self._silero_inputs = set()
+        self._silero_state: dict = {}
+        self._silero_context: Optional[np.ndarray] = None
+        self.silero_threshold = Config.SILERO_VAD_THRESHOLD
+        if Config.SILERO_VAD_MODEL:
+            self._init_silero(Config.SILERO_VAD_MODEL)
+        
+        # Preallocated per-frame scratch buffers reused across calls
+        self._int16_scratch = np.empty(self.frame_size, dtype=np.int16)
+        self._float_scratch = np.empty(self.frame_size, dtype=np.float32)
+        
         # Speech detection state
         self.is_speaking = False
         self.speech_frames = 0
         self.silence_frames = 0
+        self.speech_duration = 0.0
+        self.silence_duration = 0.0
         
         # Thresholds for speech detection
         self.speech_threshold = 5  # Frames needed to start speech
         self.silence_threshold = 10  # Frames needed to end speech
         
-        logger.info(f"🗣️  VAD initialized")
-        logger.info(f"   Sample Rate: {self.sample_rate}Hz")
-        logger.info(f"   Aggressiveness: {self.aggressiveness}")
-        logger.info(f"   Frame Duration: {self.frame_duration_ms}ms")
-        logger.info(f"   Frame Size: {self.frame_size} samples")
+        # update_speech_state() gets however much audio was captured since the
+        # last read, so it counts seconds; these match the thresholds above
+        # applied to one capture block per call
+        block_seconds = Config.BUFFER_SIZE / self.sample_rate
+        self.speech_start_duration = self.speech_threshold * block_seconds
+        self.speech_end_duration = self.silence_threshold * block_seconds
+        
+        logger.info("🗣️  VAD initialized\n"
+                    "   Sample Rate: %sHz\n"
+                    "   Aggressiveness: %s\n"
+                    "   Frame Duration: %sms\n"
+                    "   Frame Size: %s samples\n"
+                    "   Backend: %s",
+                    self.sample_rate, self.aggressiveness, self.frame_duration_ms,
+                    self.frame_size, 'silero' if self._silero is not None else 'webrtc')
+    
+    def _init_silero(self, model_path: str) -> None:
+        """Load the Silero VAD ONNX model, falling back to WebRTC VAD on failure."""
+        if onnxruntime is None:
+            logger.warning("onnxruntime not available - using WebRTC VAD")
+            return
+        
+        if self.sample_rate not in SILERO_WINDOW_SIZES:
+            logger.warning(f"Sample rate {self.sample_rate} not supported by Silero VAD - using WebRTC VAD")
+            return
+        
+        try:
+            self._silero = onnxruntime.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+            self._silero_inputs = {i.name for i in self._silero.get_inputs()}
+        except Exception as e:
+            logger.warning(f"Could not load Silero VAD model: {e} - using WebRTC VAD")
+            self._silero = None
+            return
+        
+        self._reset_silero_state()
+    
+    def _reset_silero_state(self) -> None:
+        """Start Silero from a cold recurrent state (and empty v5 context)."""
+        if 'state' in self._silero_inputs:
+            # Silero v5
+            self._silero_state = {'state': np.zeros((2, 1, 128), dtype=np.float32)}
+            self._silero_context = np.zeros(SILERO_CONTEXT_SIZES[self.sample_rate], dtype=np.float32)
+        else:
+            # Silero v4
+            self._silero_state = {'h': np.zeros((2, 1, 64), dtype=np.float32),
+                                  'c': np.zeros((2, 1, 64), dtype=np.float32)}
+            self._silero_context = None
+    
+    def _classify_frames_silero(self, audio_data: np.ndarray) -> np.ndarray:
+        """Classify frames with Silero VAD.
+        
+        The buffer is cut into model-sized windows which are scored in order,
+        feeding each window the recurrent state (and, for v5, the trailing
+        context samples) left by the previous one, as the model expects when
+        streaming. State carries over between calls until reset_state(). Each
+        VAD frame takes the score of the window covering its centre.
+        
+        Args:
+            audio_data: Audio data as numpy array
+            
+        Returns:
+            Boolean array of per-frame speech flags
+        """
+        audio = np.asarray(audio_data)
+        if audio.dtype == np.int16:
+            audio = int_to_float(audio)
+        else:
+            audio = audio.astype(np.float32, copy=False)
+        
+        n_frames = -(-len(audio) // self.frame_size)
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+        
+        window = SILERO_WINDOW_SIZES[self.sample_rate]
+        n_windows = -(-len(audio) // window)
+        batch = np.zeros((n_windows, window), dtype=np.float32)
+        batch.reshape(-1)[:len(audio)] = audio
+        
+        run = self._silero.run
+        feeds = dict(self._silero_state, sr=np.array(self.sample_rate, dtype=np.int64))
+        context = self._silero_context
+        probs = np.empty(n_windows, dtype=np.float32)
+        
+        for i, window_audio in enumerate(batch):
+            if context is not None:
+                # Silero v5: prepend the previous window's tail, carry 'state'
+                window_audio = np.concatenate((context, window_audio))
+                context = window_audio[-len(context):]
+                feeds['input'] = window_audio[None, :]
+                out, feeds['state'] = run(None, feeds)
+            else:
+                # Silero v4: carry the LSTM 'h' and 'c'
+                feeds['input'] = window_audio[None, :]
+                out, feeds['h'], feeds['c'] = run(None, feeds)
+            probs[i] = out.reshape(-1)[0]
+        
+        self._silero_state = {name: feeds[name] for name in self._silero_state}
+        self._silero_context = context
+        
+        centers = (np.arange(n_frames) * self.frame_size + self.frame_size // 2) // window
+        np.minimum(centers, n_windows - 1, out=centers)
+        return probs[centers] >= self.silero_threshold
     
     def _convert_to_pcm16(self, audio_data: np.ndarray) -> bytes:
         """Convert float32 audio to PCM16 bytes for WebRTC VAD.
@@ -73,35 +201,67 @@ class VoiceActivityDetector:
         Returns:
             PCM16 audio data as bytes
         """
-        # Convert float32 (-1.0 to 1.0) to int16 (-32768 to 32767)
-        if audio_data.dtype == np.float32:
-            audio_int16 = (audio_data * 32767).astype(np.int16)
+        if audio_data.dtype == np.int16:
+            return audio_data.tobytes()
+        
+        # Frames of the expected size are converted through fixed-size scratch
+        # buffers allocated once in __init__, so no temporaries are created
+        if len(audio_data) == self.frame_size and audio_data.dtype == np.float32:
+            scaled = self._float_scratch
+            # Convert float32 (-1.0 to 1.0) to int16 (-32768 to 32767), saturating
+            np.multiply(audio_data, np.float32(INT16_MAX), out=scaled)
+            np.clip(scaled, INT16_MIN, INT16_MAX, out=scaled)
+            audio_int16 = self._int16_scratch
+            np.copyto(audio_int16, scaled, casting='unsafe')
         else:
-            audio_int16 = audio_data.astype(np.int16)
+            audio_int16 = float_to_int16(audio_data)
         
-        # Convert to bytes
+        # webrtcvad parses its frame argument as read-only bytes and rejects
+        # bytearray/memoryview, so one immutable copy per frame is required
         return audio_int16.tobytes()
     
-    def _split_into_frames(self, audio_data: np.ndarray) -> List[np.ndarray]:
-        """Split audio data into VAD-compatible frames.
+    def _classify_frames(self, audio_data: np.ndarray) -> np.ndarray:
+        """Run WebRTC VAD over every frame of audio data.
+        
+        The whole buffer is converted to PCM16 and padded to a whole number
+        of frames once. Frame energies are computed in one vectorized pass
+        and only frames above the silence floor are handed to the VAD, so
+        quiet stretches cost no per-frame Python calls.
         
         Args:
             audio_data: Audio data as numpy array
             
         Returns:
-            List of audio frames
+            Boolean array of per-frame speech flags
         """
-        frames = []
-        for i in range(0, len(audio_data), self.frame_size):
-            frame = audio_data[i:i + self.frame_size]
-            
-            # Pad frame if necessary
-            if len(frame) < self.frame_size:
-                frame = np.pad(frame, (0, self.frame_size - len(frame)), 'constant')
-            
-            frames.append(frame)
+        if self._silero is not None:
+            return self._classify_frames_silero(audio_data)
         
-        return frames
+        frame_size = self.frame_size
+        pcm = float_to_int16(np.asarray(audio_data))
+        
+        remainder = len(pcm) % frame_size
+        if remainder:
+            pcm = np.pad(pcm, (0, frame_size - remainder), 'constant')
+        
+        # Integer energies straight from the int16 frames (int64 cannot overflow here)
+        frames = pcm.reshape(-1, frame_size)
+        energy = np.einsum('ij,ij->i', frames, frames, dtype=np.int64)
+        loud = np.flatnonzero(energy > int(SILENCE_RMS_FLOOR ** 2 * frame_size))
+        
+        results = np.zeros(len(energy), dtype=bool)
+        if not loud.size:
+            return results
+        
+        pcm_bytes = pcm.tobytes()
+        frame_bytes = frame_size * 2
+        
+        # Bind the VAD call and sample rate locally for the per-frame loop
+        is_speech = self.vad.is_speech
+        sample_rate = self.sample_rate
+        results[loud] = [is_speech(pcm_bytes[offset:offset + frame_bytes], sample_rate)
+                         for offset in (loud * frame_bytes).tolist()]
+        return results
     
     def is_speech_frame(self, audio_frame: np.ndarray) -> bool:
         """Check if a single audio frame contains speech.
@@ -127,33 +287,53 @@ class VoiceActivityDetector:
             logger.error(f"Error in VAD processing: {e}")
             return False
     
-    def detect_speech(self, audio_data: np.ndarray) -> Tuple[bool, List[bool]]:
+    def _fast_energy(self, audio_data: np.ndarray) -> float:
+        """Mean-square level of audio data in int16 units, from a single reduction."""
+        if audio_data.dtype == np.int16:
+            energy = np.einsum('i,i->', audio_data, audio_data, dtype=np.int64)
+        else:
+            audio = np.asarray(audio_data, dtype=np.float32) * np.float32(INT16_MAX)
+            energy = np.dot(audio, audio)
+        return float(energy) / len(audio_data)
+    
+    def detect_speech(self, audio_data: np.ndarray) -> Tuple[bool, np.ndarray]:
         """Detect speech in audio data.
         
+        Chunks whose overall level is below the silence floor are rejected
+        after one energy reduction, without running the frame classifier.
+        
         Args:
             audio_data: Audio data as numpy array
             
         Returns:
-            Tuple of (overall_speech_detected, frame_by_frame_results)
+            Tuple of (overall_speech_detected, boolean array of per-frame results)
         """
-        frames = self._split_into_frames(audio_data)
-        frame_results = []
-        speech_count = 0
+        if len(audio_data) == 0:
+            return False, np.zeros(0, dtype=bool)
         
-        for frame in frames:
-            is_speech = self.is_speech_frame(frame)
-            frame_results.append(is_speech)
-            if is_speech:
-                speech_count += 1
+        if self._fast_energy(audio_data) <= SILENCE_RMS_FLOOR ** 2:
+            return False, np.zeros(-(-len(audio_data) // self.frame_size), dtype=bool)
+        
+        try:
+            frame_results = self._classify_frames(audio_data)
+        except Exception as e:
+            logger.error(f"Error in VAD processing: {e}")
+            return False, np.zeros(0, dtype=bool)
+        
+        speech_count = np.count_nonzero(frame_results)
         
         # Overall speech detection (majority voting)
-        overall_speech = speech_count > len(frames) * 0.3  # 30% threshold
+        overall_speech = speech_count > len(frame_results) * 0.3  # 30% threshold
         
         return overall_speech, frame_results
     
     def update_speech_state(self, audio_data: np.ndarray) -> Tuple[bool, bool, bool]:
         """Update speech state with new audio data.
         
+        Speech starts and ends once speech or silence has lasted
+        speech_start_duration or speech_end_duration seconds, whatever the
+        size of the chunks passed in.
+        
         Args:
             audio_data: Audio data as numpy array
             
@@ -161,6 +341,7 @@ class VoiceActivityDetector:
             Tuple of (is_speaking_now, speech_started, speech_ended)
         """
         speech_detected, frame_results = self.detect_speech(audio_data)
+        chunk_duration = len(audio_data) / self.sample_rate
         
         speech_started = False
         speech_ended = False
@@ -168,18 +349,22 @@ class VoiceActivityDetector:
         if speech_detected:
             self.speech_frames += 1
             self.silence_frames = 0
+            self.speech_duration += chunk_duration
+            self.silence_duration = 0.0
             
             # Check if speech just started
-            if not self.is_speaking and self.speech_frames >= self.speech_threshold:
+            if not self.is_speaking and self.speech_duration >= self.speech_start_duration:
                 self.is_speaking = True
                 speech_started = True
                 logger.debug("🗣️  Speech started")
         else:
             self.silence_frames += 1
             self.speech_frames = 0
+            self.silence_duration += chunk_duration
+            self.speech_duration = 0.0
             
             # Check if speech just ended
-            if self.is_speaking and self.silence_frames >= self.silence_threshold:
+            if self.is_speaking and self.silence_duration >= self.speech_end_duration:
                 self.is_speaking = False
                 speech_ended = True
                 logger.debug("🤫 Speech ended")
@@ -187,66 +372,73 @@ class VoiceActivityDetector:
         return self.is_speaking, speech_started, speech_ended
     
     def get_speech_segments(self, audio_data: np.ndarray, 
-                           min_segment_duration: float = 0.5) -> List[Tuple[int, int]]:
+                           min_segment_duration: float = 0.5,
+                           frame_results: Optional[np.ndarray] = None) -> List[Tuple[int, int]]:
         """Get speech segments from audio data.
         
         Args:
             audio_data: Audio data as numpy array
             min_segment_duration: Minimum segment duration in seconds
+            frame_results: Per-frame flags already computed for audio_data (skips classification)
             
         Returns:
             List of (start_sample, end_sample) tuples for speech segments
         """
-        frames = self._split_into_frames(audio_data)
-        frame_results = [self.is_speech_frame(frame) for frame in frames]
-        
-        segments = []
-        start_frame = None
-        
-        for i, is_speech in enumerate(frame_results):
-            if is_speech and start_frame is None:
-                start_frame = i
-            elif not is_speech and start_frame is not None:
-                # End of speech segment
-                start_sample = start_frame * self.frame_size
-                end_sample = i * self.frame_size
-                duration = (end_sample - start_sample) / self.sample_rate
-                
-                if duration >= min_segment_duration:
-                    segments.append((start_sample, end_sample))
-                
-                start_frame = None
-        
-        # Handle case where audio ends during speech
-        if start_frame is not None:
-            start_sample = start_frame * self.frame_size
-            end_sample = len(audio_data)
-            duration = (end_sample - start_sample) / self.sample_rate
-            
-            if duration >= min_segment_duration:
-                segments.append((start_sample, end_sample))
+        if frame_results is None:
+            try:
+                frame_results = self._classify_frames(audio_data)
+            except Exception as e:
+                logger.error(f"Error in VAD processing: {e}")
+                return []
+        
+        if len(frame_results) == 0:
+            return []
+        
+        flags = np.asarray(frame_results, dtype=np.int8)
+        if not flags.any():
+            return []
         
-        return segments
+        # Run boundaries: +1 where speech starts, -1 where it stops
+        edges = np.diff(flags, prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1) * self.frame_size
+        ends = np.flatnonzero(edges == -1) * self.frame_size
+        
+        # A run still open at the end of the buffer ends at the last sample
+        if flags[-1]:
+            ends[-1] = len(audio_data)
+        
+        keep = (ends - starts) >= min_segment_duration * self.sample_rate
+        return list(zip(starts[keep].tolist(), ends[keep].tolist()))
     
-    def extract_speech_audio(self, audio_data: np.ndarray) -> Optional[np.ndarray]:
+    def extract_speech_audio(self, audio_data: np.ndarray,
+                             frame_results: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """Extract only speech portions from audio data.
         
         Args:
             audio_data: Audio data as numpy array
+            frame_results: Per-frame flags already computed for audio_data (skips classification)
             
         Returns:
             Audio data containing only speech segments, or None if no speech
+            (a view of audio_data when the speech is one contiguous run)
         """
-        segments = self.get_speech_segments(audio_data)
+        segments = self.get_speech_segments(audio_data, frame_results=frame_results)
         
         if not segments:
             return None
         
-        speech_audio = []
+        if len(segments) == 1:
+            start, end = segments[0]
+            return audio_data[start:end]
+        
+        # Gather every run into one output allocated at its final size
+        speech_audio = np.empty(sum(end - start for start, end in segments), dtype=audio_data.dtype)
+        offset = 0
         for start, end in segments:
-            speech_audio.append(audio_data[start:end])
+            speech_audio[offset:offset + end - start] = audio_data[start:end]
+            offset += end - start
         
-        return np.concatenate(speech_audio) if speech_audio else None
+        return speech_audio
     
     def get_stats(self) -> dict:
         """Get VAD statistics.
@@ -258,6 +450,8 @@ class VoiceActivityDetector:
             'is_speaking': self.is_speaking,
             'speech_frames': self.speech_frames,
             'silence_frames': self.silence_frames,
+            'speech_duration': self.speech_duration,
+            'silence_duration': self.silence_duration,
             'aggressiveness': self.aggressiveness,
             'sample_rate': self.sample_rate,
             'frame_size': self.frame_size
@@ -268,4 +462,8 @@ class VoiceActivityDetector:
         self.is_speaking = False
         self.speech_frames = 0
         self.silence_frames = 0
+        self.speech_duration = 0.0
+        self.silence_duration = 0.0
+        if self._silero is not None:
+            self._reset_silero_state()
         logger.debug("VAD state reset") 
\ No newline at end of file
@@ -1,8 +1,18 @@
 """Meeting actions controller for orchestrating browser automation."""
 
+import asyncio
+import atexit
+import threading
 import time
-from typing import Optional, Dict, Any, Callable
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from pathlib import Path
+import subprocess
+
+from playwright.sync_api import Error as PlaywrightError
+from sounddevice import PortAudioError
 
 from .base_interface import BrowserAutomationAgent
 from .gmeet_agent import GMeetAgent
@@ -22,9 +32,54 @@ except ImportError:
 
 logger = setup_logger("browser.actions")
 
+# Failures expected from browser automation and audio I/O; anything else is
+# a bug and propagates (only close() keeps a catch-all for cleanup)
+CONTROLLER_ERRORS = (PlaywrightError, PortAudioError, OSError, subprocess.SubprocessError,
+                     RuntimeError, ValueError)
+
+# Seconds a cached microphone state is trusted before re-reading the DOM
+MIC_STATE_TTL = 60.0
+
+# Seconds of audio from before a listen_for_speech call included in the segment
+LISTEN_PREROLL = 0.5
+
+# Seconds a get_meeting_status() snapshot is reused by repeat callers
+STATUS_CACHE_TTL = 0.2
+
+# Maximum idle agents kept warm per agent configuration
+MAX_POOLED_AGENTS = 4
+
+# An agent together with the single thread its (thread-bound) browser runs on
+PooledAgent = Tuple[BrowserAutomationAgent, ThreadPoolExecutor]
+
+def _register_exit_hook(func: Callable[[], None]) -> None:
+    """Run func at interpreter exit while executors still accept work.
+    
+    concurrent.futures stops its workers from a threading exit hook, which
+    runs before atexit handlers; hooks registered after it run before it.
+    """
+    try:
+        threading._register_atexit(func)
+    except AttributeError:
+        atexit.register(func)
+    except RuntimeError as e:
+        # Shutdown has already begun
+        logger.debug(f"Could not register exit hook: {e}")
+
 class MeetingController:
     """High-level controller for managing meeting automation."""
     
+    # Idle, already-launched agents keyed by agent configuration; closed
+    # controllers only return agents here once prewarm() has enabled pooling
+    _agent_pool: Dict[tuple, List[PooledAgent]] = {}
+    # Times each pooled agent has been checked out, for recycling; entries go with the agent
+    _agent_checkouts: "weakref.WeakKeyDictionary[BrowserAutomationAgent, int]" = weakref.WeakKeyDictionary()
+    _pool_lock = threading.Lock()
+    _pooling_enabled = False
+    
+    # The one thread that drives the browser shared by profile-less agents
+    _shared_executor: Optional[ThreadPoolExecutor] = None
+    
     def __init__(self, 
                  agent_type: str = "gmeet",
                  headless: bool = False,
@@ -42,16 +97,19 @@ class MeetingController:
         """
         self.agent_type = agent_type
         self.headless = headless
+        self._pool_key = (agent_type.lower(), headless, chrome_profile_path, use_chrome_profile)
         
-        # Initialize browser agent
-        if agent_type.lower() == "gmeet":
-            self.agent: BrowserAutomationAgent = GMeetAgent(
-                headless=headless,
-                chrome_profile_path=chrome_profile_path,
-                use_chrome_profile=use_chrome_profile
-            )
+        # Meeting defaults resolved once rather than on every join
+        self._default_url = Config.GMEET_URL
+        self._default_name = Config.AGENT_NAME
+        
+        # Reuse a pre-warmed agent when one is available
+        pooled = self._take_pooled_agent(self._pool_key)
+        if pooled is not None:
+            self.agent, self._browser_executor = pooled
+            logger.info("♻️  Reusing pre-warmed browser agent")
         else:
-            raise ValueError(f"Unsupported agent type: {agent_type}")
+            self.agent, self._browser_executor = self._create_agent(*self._pool_key)
         
         # Initialize audio I/O if requested
         self.av_input: Optional[AudioVideoInput] = None
@@ -61,12 +119,246 @@ class MeetingController:
             self.av_input = AudioVideoInput()
             self.av_output = AudioVideoOutput()
         
+        
         # State tracking
         self.meeting_active = False
         self.audio_capture_active = False
         
+        # Last known microphone state (None = unknown) and when it was observed
+        self._mic_on: Optional[bool] = None
+        self._mic_state_time = 0.0
+        
+        # Last status snapshot and when it was built
+        self._status_cache: Tuple[float, Dict[str, Any]] = (0.0, {})
+        
+        # Keep capture running into its ring buffer so listening never
+        # reopens the stream and can include audio from just before the call
+        if self.av_output:
+            self.start_audio_capture()
+        
         logger.info(f"🎬 Meeting Controller initialized ({agent_type}, headless={headless}, profile={use_chrome_profile})")
     
+    @classmethod
+    def _create_agent(cls,
+                      agent_type: str,
+                      headless: bool,
+                      chrome_profile_path: Optional[str],
+                      use_chrome_profile: bool) -> PooledAgent:
+        """Create a browser agent and the thread it runs on."""
+        if agent_type != "gmeet":
+            raise ValueError(f"Unsupported agent type: {agent_type}")
+        
+        agent = GMeetAgent(
+            headless=headless,
+            chrome_profile_path=chrome_profile_path,
+            use_chrome_profile=use_chrome_profile
+        )
+        
+        # Playwright's sync API is bound to the thread that started it, so every
+        # browser call runs on a single worker; audio work uses other threads.
+        # Agents sharing one browser must therefore also share its thread.
+        if agent.uses_shared_browser:
+            return agent, cls._get_shared_executor()
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+        return agent, executor
+    
+    @classmethod
+    def _get_shared_executor(cls) -> ThreadPoolExecutor:
+        """Get the thread that runs every shared-browser agent, creating it once."""
+        with cls._pool_lock:
+            if cls._shared_executor is None:
+                cls._shared_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-shared")
+                _register_exit_hook(cls._shutdown_shared_browser)
+            return cls._shared_executor
+    
+    @classmethod
+    def _shutdown_shared_browser(cls) -> None:
+        """Close the shared browser on its own thread and stop that thread."""
+        # Pooled agents may still be using the shared thread; close them first
+        cls.shutdown_pool()
+        
+        with cls._pool_lock:
+            executor, cls._shared_executor = cls._shared_executor, None
+        
+        if executor is not None:
+            try:
+                executor.submit(GMeetAgent.close_shared_browsers).result()
+            except RuntimeError as e:
+                # Executors refuse new work once interpreter shutdown has begun;
+                # the browser then exits with the Playwright driver process
+                logger.debug(f"Could not close shared browser: {e}")
+            executor.shutdown(wait=True)
+    
+    @classmethod
+    def _release_executor(cls, executor: ThreadPoolExecutor) -> None:
+        """Stop an agent's browser thread unless it is the shared one."""
+        if executor is not cls._shared_executor:
+            executor.shutdown(wait=True)
+    
+    @classmethod
+    def _take_pooled_agent(cls, key: tuple) -> Optional[PooledAgent]:
+        """Pop an idle agent for this configuration, if any."""
+        with cls._pool_lock:
+            pool = cls._agent_pool.get(key)
+            if not pool:
+                return None
+            pooled = pool.pop()
+            agent = pooled[0]
+            cls._agent_checkouts[agent] = cls._agent_checkouts.get(agent, 0) + 1
+            return pooled
+    
+    @classmethod
+    def _return_pooled_agent(cls, key: tuple, pooled: PooledAgent) -> bool:
+        """Park an idle agent for reuse; False if the pool is full or the agent is due for recycling."""
+        with cls._pool_lock:
+            pool = cls._agent_pool.setdefault(key, [])
+            agent = pooled[0]
+            if len(pool) >= MAX_POOLED_AGENTS or \
+                    cls._agent_checkouts.get(agent, 0) >= Config.BROWSER_POOL_RECYCLE_AFTER:
+                # The caller closes the agent; a fresh browser replaces it on next prewarm
+                cls._agent_checkouts.pop(agent, None)
+                return False
+            pool.append(pooled)
+            return True
+    
+    @classmethod
+    def prewarm(cls,
+                count: Optional[int] = None,
+                agent_type: str = "gmeet",
+                headless: bool = False,
+                chrome_profile_path: Optional[str] = None,
+                use_chrome_profile: bool = True) -> int:
+        """Launch browser agents ahead of time so new controllers start instantly.
+        
+        A persistent Chrome profile can only be opened by one browser at a
+        time, so only one agent per profile can be pre-warmed.
+        
+        Args:
+            count: Number of agents to launch (default from config)
+            agent_type: Type of meeting agent
+            headless: Whether to run browser in headless mode
+            chrome_profile_path: Path to Chrome profile directory
+            use_chrome_profile: Whether to use persistent Chrome profile
+            
+        Returns:
+            Number of agents added to the pool
+        """
+        key = (agent_type.lower(), headless, chrome_profile_path, use_chrome_profile)
+        count = Config.BROWSER_POOL_SIZE if count is None else count
+        if not cls._pooling_enabled:
+            cls._pooling_enabled = True
+            _register_exit_hook(cls.shutdown_pool)
+        
+        added = 0
+        for _ in range(count):
+            agent, executor = cls._create_agent(*key)
+            if executor.submit(agent.launch).result() and cls._return_pooled_agent(key, (agent, executor)):
+                added += 1
+            else:
+                executor.submit(agent.close).result()
+                cls._release_executor(executor)
+        
+        logger.info(f"🔥 Pre-warmed {added} browser agent(s)")
+        return added
+    
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        """Close every idle pooled agent."""
+        with cls._pool_lock:
+            pooled = [item for pool in cls._agent_pool.values() for item in pool]
+            cls._agent_pool.clear()
+            cls._agent_checkouts.clear()
+            cls._pooling_enabled = False
+        
+        for agent, executor in pooled:
+            try:
+                executor.submit(agent.close).result()
+            except RuntimeError as e:
+                logger.debug(f"Could not close pooled agent: {e}")
+            cls._release_executor(executor)
+    
+    @classmethod
+    @asynccontextmanager
+    async def acquire(cls, **kwargs):
+        """Async context manager yielding a controller that is released on exit.
+        
+        Args:
+            **kwargs: MeetingController constructor arguments
+        """
+        controller = await asyncio.to_thread(cls, **kwargs)
+        try:
+            yield controller
+        finally:
+            await asyncio.to_thread(controller.close)
+    
+    def _call_agent(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a browser agent method on the browser thread and wait for it."""
+        return self._browser_executor.submit(method, *args, **kwargs).result()
+    
+    async def _acall_agent(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a browser agent method on the browser thread without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._browser_executor, lambda: method(*args, **kwargs))
+    
+    def _wait_for_mic(self, timeout: float = 0.5) -> None:
+        """Block until the microphone is live, or for timeout if that cannot be detected."""
+        if self._call_agent(self.agent.wait_for_mic_ready, timeout) is None:
+            time.sleep(timeout)
+    
+    async def _await_mic(self, timeout: float = 0.5) -> None:
+        """Async version of _wait_for_mic()."""
+        if await self._acall_agent(self.agent.wait_for_mic_ready, timeout) is None:
+            await asyncio.sleep(timeout)
+    
+    @staticmethod
+    def _log_result(ok: bool, ok_msg: str, err_msg: str) -> None:
+        """Log the outcome of an action at info on success, error on failure."""
+        if ok:
+            logger.info(ok_msg)
+        else:
+            logger.error(err_msg)
+    
+    def _set_mic_state(self, enabled: Optional[bool]) -> None:
+        """Record the microphone state observed or set just now."""
+        self._mic_on = enabled
+        self._mic_state_time = time.monotonic()
+        self._status_cache = (0.0, {})
+    
+    def _mic_state_fresh(self) -> bool:
+        """Whether the cached microphone state is recent enough to trust."""
+        return self._mic_on is not None and time.monotonic() - self._mic_state_time < MIC_STATE_TTL
+    
+    def force_sync_mic_state(self) -> Optional[bool]:
+        """Re-read the microphone state from the page and refresh the cache.
+        
+        Returns:
+            Current microphone state, or None if it cannot be determined
+        """
+        return self.is_microphone_enabled()
+    
+    def _ensure_mic_on(self) -> None:
+        """Unmute and wait for the mic, skipping both when it is known to be on."""
+        if not self._mic_state_fresh():
+            self.force_sync_mic_state()
+        if self._mic_on:
+            return
+        
+        enabled = self._call_agent(self.agent.toggle_microphone, True)
+        self._set_mic_state(True if enabled else None)
+        self._wait_for_mic()
+    
+    async def _aensure_mic_on(self) -> None:
+        """Async version of _ensure_mic_on()."""
+        if not self._mic_state_fresh():
+            await asyncio.to_thread(self.force_sync_mic_state)
+        if self._mic_on:
+            return
+        
+        enabled = await self._acall_agent(self.agent.toggle_microphone, True)
+        self._set_mic_state(True if enabled else None)
+        await self._await_mic()
+    
     def join_meeting(self, 
                     url: Optional[str] = None, 
                     display_name: Optional[str] = None,
@@ -83,8 +375,8 @@ class MeetingController:
         """
         try:
             # Use config values if not provided
-            url = url or Config.GMEET_URL
-            display_name = display_name or Config.AGENT_NAME
+            url = url or self._default_url
+            display_name = display_name or self._default_name
             
             if not url:
                 logger.error("No meeting URL provided")
@@ -93,22 +385,21 @@ class MeetingController:
             logger.info(f"🚀 Joining meeting as '{display_name}'...")
             
             # Join the meeting
-            success = self.agent.join_meeting(url, display_name)
+            success = self._call_agent(self.agent.join_meeting, url, display_name)
             
             if success:
                 self.meeting_active = True
-                logger.info("✅ Successfully joined meeting")
-                
-                # Start audio capture if requested
-                if start_audio_capture and self.av_output:
-                    self.start_audio_capture()
-                
-                return True
-            else:
-                logger.error("❌ Failed to join meeting")
-                return False
+                self._status_cache = (0.0, {})
+                self._set_mic_state(None)
+            self._log_result(success, "✅ Successfully joined meeting", "❌ Failed to join meeting")
+            
+            # Start audio capture if requested
+            if success and start_audio_capture and self.av_output and not self.audio_capture_active:
+                self.start_audio_capture()
+            
+            return success
                 
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error joining meeting: {e}")
             return False
     
@@ -131,17 +422,17 @@ class MeetingController:
                 self.stop_audio_capture()
             
             # Leave the meeting
-            success = self.agent.leave_meeting()
+            success = self._call_agent(self.agent.leave_meeting)
             
             if success:
                 self.meeting_active = False
-                logger.info("👋 Successfully left meeting")
-            else:
-                logger.error("❌ Failed to leave meeting")
+                self._status_cache = (0.0, {})
+                self._set_mic_state(None)
+            self._log_result(success, "👋 Successfully left meeting", "❌ Failed to leave meeting")
             
             return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error leaving meeting: {e}")
             return False
     
@@ -167,13 +458,12 @@ class MeetingController:
             
             if success:
                 self.audio_capture_active = True
-                logger.info("🎤 Audio capture started")
-            else:
-                logger.error("❌ Failed to start audio capture")
+                self._status_cache = (0.0, {})
+            self._log_result(success, "🎤 Audio capture started", "❌ Failed to start audio capture")
             
             return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error starting audio capture: {e}")
             return False
     
@@ -196,13 +486,12 @@ class MeetingController:
             
             if success:
                 self.audio_capture_active = False
-                logger.info("🛑 Audio capture stopped")
-            else:
-                logger.error("❌ Failed to stop audio capture")
+                self._status_cache = (0.0, {})
+            self._log_result(success, "🛑 Audio capture stopped", "❌ Failed to stop audio capture")
             
             return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error stopping audio capture: {e}")
             return False
     
@@ -225,13 +514,10 @@ class MeetingController:
                 logger.warning("Not in a meeting")
                 return False
             
-            logger.info(f"🗣️  Speaking: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            logger.info("🗣️  Speaking: '%.50s%s'", text, '...' if len(text) > 50 else '')
             
-            # Unmute microphone
-            self.agent.toggle_microphone(True)
-            
-            # Wait a moment for mic to activate
-            time.sleep(0.5)
+            # Unmute microphone (skipped if already on) and wait for it to activate
+            self._ensure_mic_on()
             
             # Inject TTS audio
             success = self.av_input.inject_tts_text(text, voice, blocking=True)
@@ -241,7 +527,7 @@ class MeetingController:
             
             return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error speaking text: {e}")
             return False
     
@@ -266,15 +552,14 @@ class MeetingController:
             
             # Unmute microphone if requested
             if unmute_first:
-                self.agent.toggle_microphone(True)
-                time.sleep(0.5)
+                self._ensure_mic_on()
             
             # Play audio file
             success = self.av_input.inject_audio_file(file_path, blocking=True)
             
             return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error playing audio file: {e}")
             return False
     
@@ -297,19 +582,13 @@ class MeetingController:
                 logger.error("Audio output not initialized")
                 return None
             
-            if not self.audio_capture_active:
-                logger.warning("Audio capture not active - starting temporarily")
-                temp_capture = True
-                self.start_audio_capture()
-            else:
-                temp_capture = False
+            # Capture is left running afterwards rather than torn down per call
+            if not self.audio_capture_active and not self.start_audio_capture():
+                return None
             
             # Capture speech segment
-            audio_data = self.av_output.capture_speech_segment(max_duration, silence_timeout)
-            
-            # Stop temporary capture
-            if temp_capture:
-                self.stop_audio_capture()
+            audio_data = self.av_output.capture_speech_segment(max_duration, silence_timeout,
+                                                               preroll=LISTEN_PREROLL)
             
             if audio_data is None:
                 logger.warning("No speech captured")
@@ -322,7 +601,7 @@ class MeetingController:
             else:
                 return "captured"
                 
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error listening for speech: {e}")
             return None
     
@@ -340,9 +619,9 @@ class MeetingController:
                 logger.warning("Not in a meeting")
                 return False
             
-            return self.agent.send_chat_message(message)
+            return self._call_agent(self.agent.send_chat_message, message)
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error sending chat message: {e}")
             return False
     
@@ -360,9 +639,11 @@ class MeetingController:
                 logger.warning("Not in a meeting")
                 return False
             
-            return self.agent.toggle_microphone(enabled)
+            success = self._call_agent(self.agent.toggle_microphone, enabled)
+            self._set_mic_state(enabled if success else None)
+            return success
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error toggling microphone: {e}")
             return False
     
@@ -380,18 +661,146 @@ class MeetingController:
                 logger.warning("Not in a meeting")
                 return False
             
-            return self.agent.toggle_camera(enabled)
+            return self._call_agent(self.agent.toggle_camera, enabled)
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"❌ Error toggling camera: {e}")
             return False
     
-    def get_meeting_status(self) -> Dict[str, Any]:
+    def is_microphone_enabled(self) -> Optional[bool]:
+        """Check whether the meeting microphone is on.
+        
+        Returns:
+            True/False for the current state, or None if it cannot be determined
+        """
+        try:
+            if not self.meeting_active:
+                return None
+            
+            state = self._call_agent(self.agent.is_microphone_enabled)
+            self._set_mic_state(state)
+            return state
+            
+        except CONTROLLER_ERRORS as e:
+            logger.error(f"❌ Error checking microphone state: {e}")
+            return None
+    
+    def is_camera_enabled(self) -> Optional[bool]:
+        """Check whether the meeting camera is on.
+        
+        Returns:
+            True/False for the current state, or None if it cannot be determined
+        """
+        try:
+            if not self.meeting_active:
+                return None
+            
+            return self._call_agent(self.agent.is_camera_enabled)
+            
+        except CONTROLLER_ERRORS as e:
+            logger.error(f"❌ Error checking camera state: {e}")
+            return None
+    
+    # === ASYNC API ===
+    # Coroutine counterparts for callers on an event loop. Browser calls are
+    # serialized on the browser thread; audio work runs in worker threads so
+    # it can overlap with DOM round-trips.
+    
+    async def ajoin_meeting(self,
+                            url: Optional[str] = None,
+                            display_name: Optional[str] = None,
+                            start_audio_capture: bool = True) -> bool:
+        """Async version of join_meeting()."""
+        return await asyncio.to_thread(self.join_meeting, url, display_name, start_audio_capture)
+    
+    async def aleave_meeting(self, stop_audio_capture: bool = True) -> bool:
+        """Async version of leave_meeting()."""
+        return await asyncio.to_thread(self.leave_meeting, stop_audio_capture)
+    
+    async def aspeak_text(self, text: str, voice: str = "alloy") -> bool:
+        """Async version of speak_text()."""
+        try:
+            if not self.av_input:
+                logger.error("Audio input not initialized")
+                return False
+            
+            if not self.meeting_active:
+                logger.warning("Not in a meeting")
+                return False
+            
+            logger.info("🗣️  Speaking: '%.50s%s'", text, '...' if len(text) > 50 else '')
+            
+            # Unmute microphone (skipped if already on) and wait for it to activate
+            await self._aensure_mic_on()
+            
+            # Inject TTS audio
+            return await asyncio.to_thread(self.av_input.inject_tts_text, text, voice, True)
+            
+        except CONTROLLER_ERRORS as e:
+            logger.error(f"❌ Error speaking text: {e}")
+            return False
+    
+    async def aplay_audio_file(self, file_path: Path, unmute_first: bool = True) -> bool:
+        """Async version of play_audio_file()."""
+        try:
+            if not self.av_input:
+                logger.error("Audio input not initialized")
+                return False
+            
+            if not self.meeting_active:
+                logger.warning("Not in a meeting")
+                return False
+            
+            # Unmute microphone if requested
+            if unmute_first:
+                await self._aensure_mic_on()
+            
+            # Play audio file on the injection workers rather than a fresh thread per call
+            return await asyncio.wrap_future(self.av_input.inject_audio_file_async(file_path))
+            
+        except CONTROLLER_ERRORS as e:
+            logger.error(f"❌ Error playing audio file: {e}")
+            return False
+    
+    async def alisten_for_speech(self,
+                                 max_duration: float = 10.0,
+                                 silence_timeout: float = 3.0,
+                                 save_to_file: bool = False) -> Optional[str]:
+        """Async version of listen_for_speech()."""
+        return await asyncio.to_thread(self.listen_for_speech, max_duration, silence_timeout, save_to_file)
+    
+    async def asend_chat_message(self, message: str) -> bool:
+        """Async version of send_chat_message()."""
+        return await asyncio.to_thread(self.send_chat_message, message)
+    
+    async def atoggle_microphone(self, enabled: bool) -> bool:
+        """Async version of toggle_microphone()."""
+        return await asyncio.to_thread(self.toggle_microphone, enabled)
+    
+    async def atoggle_camera(self, enabled: bool) -> bool:
+        """Async version of toggle_camera()."""
+        return await asyncio.to_thread(self.toggle_camera, enabled)
+    
+    async def ais_microphone_enabled(self) -> Optional[bool]:
+        """Async version of is_microphone_enabled()."""
+        return await asyncio.to_thread(self.is_microphone_enabled)
+    
+    def get_meeting_status(self, force: bool = False) -> Dict[str, Any]:
         """Get comprehensive meeting status.
         
+        Snapshots are reused for STATUS_CACHE_TTL seconds so polling loops
+        don't query the browser and audio devices on every tick.
+        
+        Args:
+            force: Rebuild the snapshot even if the cached one is fresh
+        
         Returns:
             Dictionary with meeting status information
         """
+        built_at, cached = self._status_cache
+        if not force and cached and time.monotonic() - built_at < STATUS_CACHE_TTL:
+            return cached
+        
         try:
             status = {
                 "controller": {
@@ -399,14 +808,15 @@ class MeetingController:
                     "audio_capture_active": self.audio_capture_active,
                     "agent_type": self.agent_type
                 },
-                "agent": self.agent.get_meeting_info() if self.meeting_active else {},
+                "agent": self._call_agent(self.agent.get_meeting_info) if self.meeting_active else {},
                 "audio_input": self.av_input.get_injection_status() if self.av_input else {},
                 "audio_output": self.av_output.get_capture_status() if self.av_output else {}
             }
             
+            self._status_cache = (time.monotonic(), status)
             return status
             
-        except Exception as e:
+        except CONTROLLER_ERRORS as e:
             logger.error(f"Error getting meeting status: {e}")
             return {"error": str(e)}
     
@@ -417,8 +827,22 @@ class MeetingController:
             if self.meeting_active:
                 self.leave_meeting()
             
-            # Close agent
-            self.agent.close()
+            # Capture runs from __init__ whether or not a meeting was joined;
+            # closing the AV systems stops the input/output streams, lets
+            # background WAV writes finish and shuts down their worker threads
+            if self.av_output:
+                self.av_output.close()
+                self.audio_capture_active = False
+            if self.av_input:
+                self.av_input.close()
+            
+            # Park the agent for reuse, or close it if it cannot be reset
+            if self._pooling_enabled and self._call_agent(self.agent.reset) and \
+                    self._return_pooled_agent(self._pool_key, (self.agent, self._browser_executor)):
+                logger.info("♻️  Browser agent returned to pool")
+            else:
+                self._call_agent(self.agent.close)
+                self._release_executor(self._browser_executor)
             
             logger.info("🔒 Meeting Controller closed")
             
@@ -1,14 +1,18 @@
 """Audio/Video input module for browser automation."""
 
+import asyncio
 import subprocess
+import time
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 import numpy as np
 
 try:
     from ..audio.playback import AudioPlayback
+    from ..utils.config import Config
     from ..utils.logger import setup_logger
 except ImportError:
     # Handle direct module execution
@@ -16,16 +20,52 @@ except ImportError:
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from audio.playback import AudioPlayback
+    from utils.config import Config
     from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from ..ai.tts_client import TTSClient
+    from ..ai.tts_cache import TTSCache
+
 logger = setup_logger("browser.av_input")
 
+# Seconds an ffplay process gets to exit after terminate() before it is killed
+FFPLAY_STOP_TIMEOUT = 2.0
+
+def _tts_modules():
+    """Import the TTS client and cache modules on first use.
+    
+    The ai package only imports as part of src, so loading it lazily keeps
+    the browser package importable with src/ itself on sys.path.
+    """
+    from ..ai import tts_client, tts_cache
+    return tts_client, tts_cache
+
 class AudioVideoInput:
     """Handles audio and video input injection for browser automation."""
     
-    def __init__(self):
-        """Initialize AV input system."""
+    def __init__(self, tts_client: Optional["TTSClient"] = None,
+                 tts_cache: Optional["TTSCache"] = None):
+        """Initialize AV input system.
+        
+        Args:
+            tts_client: TTS client for speech injection (created on first use if None)
+            tts_cache: Cache of synthesized phrases (default from config)
+        """
         self.audio_playback = AudioPlayback()
+        self.tts_client = tts_client
+        
+        # Repeated phrases are replayed from disk instead of re-synthesized
+        self.tts_cache = tts_cache
+        if self.tts_cache is None and Config.TTS_CACHE_ENABLED:
+            try:
+                self.tts_cache = _tts_modules()[1].TTSCache()
+            except (ImportError, OSError) as e:
+                logger.warning(f"⚠️  TTS cache unavailable: {e}")
+        self._ffplay: Optional[subprocess.Popen] = None
+        
+        # Shared workers for non-blocking file injection (file decode + playback wait)
+        self._io_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="av-inject")
         logger.info("🎬 AudioVideo Input system initialized")
     
     def inject_audio_file(self, file_path: Union[str, Path], blocking: bool = True) -> bool:
@@ -44,7 +84,7 @@ class AudioVideoInput:
                 logger.error(f"Audio file not found: {file_path}")
                 return False
             
-            logger.info(f"🎵 Injecting audio file: {file_path.name}")
+            logger.info("🎵 Injecting audio file: %s", file_path.name)
             success = self.audio_playback.play_audio_file(file_path, blocking=blocking)
             
             if success:
@@ -58,6 +98,17 @@ class AudioVideoInput:
             logger.error(f"❌ Error injecting audio file: {e}")
             return False
     
+    def inject_audio_file_async(self, file_path: Union[str, Path]) -> Future:
+        """Inject audio from file without blocking the caller.
+        
+        Args:
+            file_path: Path to audio file (WAV, MP3)
+            
+        Returns:
+            Future resolving to True once playback has completed successfully
+        """
+        return self._io_exec.submit(self.inject_audio_file, file_path, True)
+    
     def inject_audio_data(self, audio_data: np.ndarray, blocking: bool = True) -> bool:
         """Inject raw audio data into the meeting via BlackHole.
         
@@ -69,8 +120,14 @@ class AudioVideoInput:
             True if successfully injected
         """
         try:
-            logger.info(f"🎵 Injecting audio data: {len(audio_data)} samples")
-            success = self.audio_playback.play_audio_data(audio_data, blocking=blocking)
+            logger.info("🎵 Injecting audio data: %d samples", len(audio_data))
+            
+            # Validate once at the boundary; matching contiguous arrays are queued without a copy
+            if audio_data.dtype != self.audio_playback.dtype or not audio_data.flags['C_CONTIGUOUS']:
+                logger.debug("Converting injected audio from %s to %s", audio_data.dtype, self.audio_playback.dtype)
+                audio_data = self.audio_playback.prepare_audio(audio_data)
+            
+            success = self.audio_playback.play_audio_data(audio_data, blocking=blocking, assume_ready=True)
             
             if success:
                 logger.info("✅ Audio data injection completed")
@@ -91,32 +148,108 @@ class AudioVideoInput:
             voice: Voice to use for TTS
             blocking: Whether to wait for playback to complete
             
+        Returns:
+            True if successfully injected
+        """
+        if self.tts_cache is None:
+            return self.inject_tts_stream(text, voice, blocking=blocking)
+        
+        try:
+            if self.tts_client is None:
+                self.tts_client = _tts_modules()[0].TTSClient()
+            
+            cache_path = self.tts_cache.path_for(text, voice, self.tts_client.model, self.tts_client.speed)
+            if self.tts_cache.get(cache_path) is not None:
+                logger.debug("TTS cache hit: %s", cache_path.name)
+                return self.inject_audio_file(cache_path, blocking=blocking)
+        except Exception as e:
+            logger.error(f"❌ Error injecting TTS: {e}")
+            return False
+        
+        return self.inject_tts_stream(text, voice, blocking=blocking, cache_path=cache_path)
+    
+    def inject_tts_stream(self, text: str, voice: str = "alloy", blocking: bool = True,
+                          cache_path: Optional[Path] = None) -> bool:
+        """Stream synthesized speech into the meeting as it is generated.
+        
+        PCM chunks are queued for playback as soon as they arrive, so the
+        meeting hears the start of the utterance before synthesis finishes.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use for TTS
+            blocking: Whether to wait for playback to complete
+            cache_path: Where to store the synthesized audio in the TTS cache
+            
         Returns:
             True if successfully injected
         """
         try:
-            logger.info(f"🗣️  Converting text to speech: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+            logger.info("🗣️  Converting text to speech: '%.50s%s'", text, '...' if len(text) > 50 else '')
             
-            # This will be enhanced when we add TTS integration
-            # For now, use the playback system's TTS placeholder
-            success = self.audio_playback.play_tts_response(text, voice)
+            tts_client_module = _tts_modules()[0]
+            sample_rate = tts_client_module.PCM_SAMPLE_RATE
+            if self.tts_client is None:
+                self.tts_client = tts_client_module.TTSClient()
             
-            if success:
-                logger.info("✅ TTS injection completed")
-            else:
-                logger.warning("⚠️  TTS not yet implemented - placeholder used")
+            queued = 0
+            frames = []
+            self.audio_playback.reset_pcm_stream()
+            for frame in self.tts_client.stream_pcm(text, voice):
+                if not self.audio_playback.write_pcm_frame(frame, sample_rate):
+                    logger.error("❌ TTS injection failed")
+                    return False
+                queued += len(frame)
+                if cache_path is not None:
+                    frames.append(frame)
             
-            return success
+            if not queued:
+                logger.warning("⚠️  TTS produced no audio")
+                return False
+            
+            if cache_path is not None:
+                self.tts_cache.put(cache_path, frames, sample_rate)
+            
+            if blocking:
+                self.audio_playback.wait_for_playback_complete(queued / sample_rate + 5.0)
+            
+            logger.info("✅ TTS injection completed")
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error injecting TTS: {e}")
             return False
     
-    def inject_audio_with_ffmpeg(self, file_path: Union[str, Path]) -> bool:
+    def _stop_ffplay(self) -> None:
+        """Terminate the ffplay process, if any, and reap it."""
+        proc, self._ffplay = self._ffplay, None
+        if proc is None:
+            return
+        
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=FFPLAY_STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+    
+    def _ffplay_command(self, file_path: Path) -> list:
+        """Build the ffplay command line for a file (routes through default output)."""
+        return [
+            "ffplay",
+            "-nodisp",           # No video display
+            "-autoexit",         # Exit when done
+            "-loglevel", "quiet", # Suppress ffmpeg logs
+            str(file_path)
+        ]
+    
+    def inject_audio_with_ffmpeg(self, file_path: Union[str, Path], blocking: bool = True) -> bool:
         """Inject audio using ffmpeg (alternative method).
         
         Args:
             file_path: Path to audio file
+            blocking: Whether to wait for playback to complete
             
         Returns:
             True if successfully injected
@@ -127,28 +260,70 @@ class AudioVideoInput:
                 logger.error(f"Audio file not found: {file_path}")
                 return False
             
-            logger.info(f"🎵 Injecting audio with ffmpeg: {file_path.name}")
+            logger.info("🎵 Injecting audio with ffmpeg: %s", file_path.name)
             
-            # Use ffplay to play audio (will route through default output)
-            cmd = [
-                "ffplay",
-                "-nodisp",           # No video display
-                "-autoexit",         # Exit when done
-                "-loglevel", "quiet", # Suppress ffmpeg logs
-                str(file_path)
-            ]
+            # Only one ffplay at a time; a non-blocking one may still be playing
+            self._stop_ffplay()
             
             try:
-                result = subprocess.run(cmd, check=True, capture_output=True)
-                logger.info("✅ FFmpeg audio injection completed")
+                # Output is discarded rather than buffered in memory for long files
+                self._ffplay = subprocess.Popen(self._ffplay_command(file_path),
+                                                stdin=subprocess.DEVNULL,
+                                                stdout=subprocess.DEVNULL,
+                                                stderr=subprocess.DEVNULL)
+            except FileNotFoundError:
+                logger.error("FFmpeg not found - install with 'brew install ffmpeg'")
+                return False
+            
+            if not blocking:
                 return True
-            except subprocess.CalledProcessError as e:
-                logger.error(f"FFmpeg failed: {e}")
+            
+            returncode = self._ffplay.wait()
+            if returncode != 0:
+                logger.error(f"FFmpeg failed with exit code {returncode}")
+                return False
+            
+            logger.info("✅ FFmpeg audio injection completed")
+            return True
+                
+        except Exception as e:
+            logger.error(f"❌ Error with ffmpeg injection: {e}")
+            return False
+    
+    async def inject_audio_with_ffmpeg_async(self, file_path: Union[str, Path]) -> bool:
+        """Inject audio using ffmpeg without blocking the event loop.
+        
+        Args:
+            file_path: Path to audio file
+            
+        Returns:
+            True if successfully injected
+        """
+        try:
+            file_path = Path(file_path)
+            if not file_path.exists():
+                logger.error(f"Audio file not found: {file_path}")
                 return False
+            
+            logger.info("🎵 Injecting audio with ffmpeg: %s", file_path.name)
+            
+            try:
+                proc = await asyncio.create_subprocess_exec(*self._ffplay_command(file_path),
+                                                            stdin=asyncio.subprocess.DEVNULL,
+                                                            stdout=asyncio.subprocess.DEVNULL,
+                                                            stderr=asyncio.subprocess.DEVNULL)
             except FileNotFoundError:
                 logger.error("FFmpeg not found - install with 'brew install ffmpeg'")
                 return False
-                
+            
+            returncode = await proc.wait()
+            if returncode != 0:
+                logger.error(f"FFmpeg failed with exit code {returncode}")
+                return False
+            
+            logger.info("✅ FFmpeg audio injection completed")
+            return True
+            
         except Exception as e:
             logger.error(f"❌ Error with ffmpeg injection: {e}")
             return False
@@ -164,7 +339,7 @@ class AudioVideoInput:
             True if successfully injected
         """
         try:
-            logger.info(f"🎵 Injecting test tone: {frequency}Hz for {duration}s")
+            logger.info("🎵 Injecting test tone: %sHz for %ss", frequency, duration)
             success = self.audio_playback.test_playback(frequency, duration)
             
             if success:
@@ -186,6 +361,7 @@ class AudioVideoInput:
         """
         try:
             self.audio_playback.stop_playback()
+            self._stop_ffplay()
             logger.info("🛑 Audio injection stopped")
             return True
             
@@ -203,7 +379,19 @@ class AudioVideoInput:
             True if completed, False if timeout
         """
         try:
-            return self.audio_playback.wait_for_playback_complete(timeout)
+            # Blocks on the playback Event; no polling interval
+            deadline = time.monotonic() + timeout
+            if not self.audio_playback.wait_for_playback_complete(timeout):
+                return False
+            
+            # Also wait for a non-blocking ffplay injection, if one is running
+            if self._ffplay is not None and self._ffplay.poll() is None:
+                try:
+                    self._ffplay.wait(timeout=max(0.0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    return False
+            
+            return True
         except Exception as e:
             logger.error(f"❌ Error waiting for injection: {e}")
             return False
@@ -223,4 +411,11 @@ class AudioVideoInput:
             }
         except Exception as e:
             logger.error(f"Error getting injection status: {e}")
-            return {"error": str(e)} 
\ No newline at end of file
+            return {"error": str(e)}
+    
+    def close(self) -> None:
+        """Stop injection and release the output stream and worker threads."""
+        self.stop_audio_injection()
+        self._stop_ffplay()  # In case stop_audio_injection() failed before reaching it
+        self._io_exec.shutdown(wait=False, cancel_futures=True)
+        self.audio_playback.close()
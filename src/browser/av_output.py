@@ -1,7 +1,8 @@
 """Audio/Video output module for browser automation."""
 
 import time
-from typing import Optional, Callable, Any
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional, Callable, Any, Literal
 import numpy as np
 from pathlib import Path
 
@@ -20,15 +21,23 @@ except ImportError:
 
 logger = setup_logger("browser.av_output")
 
+# Upper bound on the audio held for one speech segment, whatever max_duration is
+MAX_SEGMENT_SECONDS = 120.0
+
 class AudioVideoOutput:
     """Handles audio and video output capture for browser automation."""
     
+    __slots__ = ("audio_capture", "vad", "capturing", "audio_callback", "_save_exec")
+    
     def __init__(self):
         """Initialize AV output system."""
         self.audio_capture = AudioCapture()
         self.vad = VoiceActivityDetector()
         self.capturing = False
         self.audio_callback: Optional[Callable] = None
+        
+        # WAV writes run here, in submission order, off the caller's thread
+        self._save_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="av-save")
         logger.info("🎤 AudioVideo Output system initialized")
     
     def start_audio_capture(self, callback: Optional[Callable] = None) -> bool:
@@ -82,6 +91,17 @@ class AudioVideoOutput:
             logger.error(f"❌ Error stopping audio capture: {e}")
             return False
     
+    def wait_for_capture(self, timeout: float = 1.0) -> bool:
+        """Wait until the capture stream delivers its first audio block.
+        
+        Args:
+            timeout: Timeout in seconds
+            
+        Returns:
+            True if audio is flowing
+        """
+        return self.capturing and self.audio_capture.wait_until_ready(timeout)
+    
     def capture_audio_chunk(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """Capture a single audio chunk.
         
@@ -103,7 +123,7 @@ class AudioVideoOutput:
                 try:
                     self.audio_callback(chunk)
                 except Exception as e:
-                    logger.error(f"Error in audio callback: {e}")
+                    logger.error("Error in audio callback: %s", e)
             
             return chunk
             
@@ -111,6 +131,49 @@ class AudioVideoOutput:
             logger.error(f"❌ Error capturing audio chunk: {e}")
             return None
     
+    def capture_audio_chunk_into(self, out: np.ndarray, timeout: float = 1.0) -> int:
+        """Capture a single audio chunk into a preallocated buffer.
+        
+        Args:
+            out: Destination array; samples are written to out[:n]
+            timeout: Timeout in seconds
+            
+        Returns:
+            Number of samples captured (0 on timeout)
+        """
+        try:
+            if not self.capturing:
+                logger.warning("Audio capture not running")
+                return 0
+            
+            n = self.audio_capture.get_audio_chunk_into(out, timeout)
+            
+            # Call callback if provided
+            if n and self.audio_callback:
+                try:
+                    self.audio_callback(out[:n])
+                except Exception as e:
+                    logger.error("Error in audio callback: %s", e)
+            
+            return n
+            
+        except Exception as e:
+            logger.error(f"❌ Error capturing audio chunk: {e}")
+            return 0
+    
+    def _pull_chunk_into(self, out: np.ndarray, timeout: float) -> int:
+        """Unguarded capture_audio_chunk_into() for the speech loop, used only with a callback set.
+        
+        Capture errors propagate to the caller; only the user callback is guarded.
+        """
+        n = self.audio_capture.get_audio_chunk_into(out, timeout)
+        if n:
+            try:
+                self.audio_callback(out[:n])
+            except Exception as e:
+                logger.error("Error in audio callback: %s", e)
+        return n
+    
     def capture_audio_buffer(self, duration: float) -> Optional[np.ndarray]:
         """Capture audio for a specific duration.
         
@@ -125,11 +188,11 @@ class AudioVideoOutput:
                 logger.warning("Audio capture not running")
                 return None
             
-            logger.info(f"🎵 Capturing audio buffer for {duration}s...")
+            logger.info("🎵 Capturing audio buffer for %ss...", duration)
             audio_buffer = self.audio_capture.get_audio_buffer(duration)
             
             if audio_buffer is not None:
-                logger.info(f"✅ Captured {len(audio_buffer)} samples")
+                logger.info("✅ Captured %d samples", len(audio_buffer))
             else:
                 logger.warning("⚠️  No audio captured")
             
@@ -140,72 +203,138 @@ class AudioVideoOutput:
             return None
     
     def capture_speech_segment(self, max_duration: float = 10.0, 
-                              silence_timeout: float = 3.0) -> Optional[np.ndarray]:
+                              silence_timeout: float = 3.0,
+                              preroll: float = 0.0,
+                              on_overflow: Literal["stop", "wrap"] = "stop") -> Optional[np.ndarray]:
         """Capture a speech segment using voice activity detection.
         
         Args:
             max_duration: Maximum duration to capture in seconds
             silence_timeout: Seconds of silence before stopping capture
+            preroll: Seconds of already-buffered audio to include from before the call
+            on_overflow: When the segment buffer (at most MAX_SEGMENT_SECONDS) fills,
+                "stop" capturing or "wrap" by discarding the oldest half
             
         Returns:
             Audio data containing speech or None
         """
+        if on_overflow not in ("stop", "wrap"):
+            raise ValueError(f"on_overflow must be 'stop' or 'wrap', got {on_overflow!r}")
+        
         try:
             if not self.capturing:
                 logger.warning("Audio capture not running")
                 return None
             
+            # Start from the recent past so a word spoken just before the call is kept
+            self.audio_capture.trim_buffer(preroll)
+            
             logger.info("🗣️  Waiting for speech...")
             
-            audio_chunks = []
-            speech_detected = False
-            silence_duration = 0.0
-            start_time = time.time()
+            voiced_frames = 0
+            trailing_silent_frames = 0
+            sample_rate = self.audio_capture.sample_rate
+            deadline_ns = time.monotonic_ns() + int(max_duration * 1e9)
+            
+            # Segment buffer sized once for the longest possible capture (plus
+            # preroll and one late chunk, capped); the ring copies straight into it
+            capacity = int(min(max_duration + preroll + 1.0, MAX_SEGMENT_SECONDS) * sample_rate)
+            full_audio = np.empty(capacity, dtype=self.audio_capture.dtype)
+            write_idx = 0
+            chunks = 0
+            
+            # Every frame is classified exactly once, in order, as whole frames
+            # become available; the flags are reused for speech extraction
+            frame_size = self.vad.frame_size
+            frame_duration = frame_size / sample_rate
+            silence_frames = -(-int(silence_timeout * sample_rate) // frame_size)
+            frame_flags = np.zeros(capacity // frame_size, dtype=bool)
+            classified = 0
             
-            while (time.time() - start_time) < max_duration:
-                # Get audio chunk
-                chunk = self.capture_audio_chunk(timeout=0.1)
-                if chunk is None:
+            # Bind per-iteration lookups locally for the capture loop
+            monotonic_ns = time.monotonic_ns
+            # Pick the chunk reader once: with no callback the loop reads the
+            # capture ring directly; errors are handled around the whole loop
+            get_chunk_into = (self._pull_chunk_into if self.audio_callback is not None
+                              else self.audio_capture.get_audio_chunk_into)
+            detect_speech = self.vad.detect_speech
+            speech_threshold = self.vad.speech_threshold
+            
+            while True:
+                remaining_ns = deadline_ns - monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                
+                if write_idx == capacity:
+                    if on_overflow == "stop":
+                        break
+                    # Keep the newer half: shift audio and flags down by whole classified frames
+                    drop = classified // 2 // frame_size * frame_size
+                    if not drop:
+                        break
+                    full_audio[:write_idx - drop] = full_audio[drop:write_idx]
+                    frame_flags[:(classified - drop) // frame_size] = \
+                        frame_flags[drop // frame_size:classified // frame_size]
+                    write_idx -= drop
+                    classified -= drop
+                
+                # Sleep on the capture ring's data event until audio arrives or time is up
+                n = get_chunk_into(full_audio[write_idx:], timeout=remaining_ns / 1e9)
+                if not n:
+                    if not self.audio_capture.recording:
+                        break
                     continue
                 
-                audio_chunks.append(chunk)
+                write_idx += n
+                chunks += 1
                 
-                # Check for speech in this chunk
-                is_speaking, speech_started, speech_ended = self.vad.update_speech_state(chunk)
+                # Classify the new whole frames so the segment ends right after
+                # the last voiced frame instead of after a chunk-level hangover
+                end = classified + (write_idx - classified) // frame_size * frame_size
+                if end == classified:
+                    continue
                 
-                if speech_started:
-                    logger.debug("🗣️  Speech started")
-                    speech_detected = True
-                    silence_duration = 0.0
+                _, frame_results = detect_speech(full_audio[classified:end])
+                first = classified // frame_size
+                flags = frame_flags[first:first + len(frame_results)]
+                flags[:] = frame_results
+                classified = end
+                voiced = np.flatnonzero(flags)
                 
-                if speech_ended:
-                    logger.debug("🤫 Speech ended")
-                    silence_duration = 0.0
+                if voiced.size:
+                    voiced_frames += voiced.size
+                    trailing_silent_frames = len(flags) - 1 - int(voiced[-1])
+                else:
+                    trailing_silent_frames += len(flags)
                 
-                # Track silence duration
-                if speech_detected and not is_speaking:
-                    silence_duration += len(chunk) / self.audio_capture.sample_rate
-                    
-                    if silence_duration >= silence_timeout:
-                        logger.info(f"✅ Speech segment captured ({silence_duration:.1f}s silence)")
-                        break
+                # voiced_frames only grows, so this single test covers both
+                # "speech has started" and "it has now gone quiet"
+                if trailing_silent_frames >= silence_frames and voiced_frames >= speech_threshold:
+                    break
             
-            if not audio_chunks:
+            if not write_idx:
                 logger.warning("No audio captured")
                 return None
             
-            # Concatenate all chunks
-            full_audio = np.concatenate(audio_chunks)
+            # One summary line per segment instead of logging inside the loop
+            logger.info("✅ Speech segment captured (%d chunks, %.2fs audio, %d ms voiced, %.1fs trailing silence)",
+                        chunks, write_idx / sample_rate,
+                        int(np.count_nonzero(frame_flags[:classified // frame_size]) * frame_duration * 1000),
+                        trailing_silent_frames * frame_duration)
+            
+            full_audio = full_audio[:write_idx]
             
             # Extract only speech portions if speech was detected
+            speech_detected = voiced_frames >= speech_threshold
             if speech_detected:
-                speech_audio = self.vad.extract_speech_audio(full_audio)
+                speech_audio = self.vad.extract_speech_audio(full_audio,
+                                                             frame_results=frame_flags[:classified // frame_size])
                 if speech_audio is not None:
-                    logger.info(f"🗣️  Extracted speech: {len(speech_audio)/self.audio_capture.sample_rate:.2f}s")
+                    logger.info("🗣️  Extracted speech: %.2fs", len(speech_audio) / sample_rate)
                     return speech_audio
             
             # Return full audio if no speech extraction possible
-            logger.info(f"📼 Captured audio segment: {len(full_audio)/self.audio_capture.sample_rate:.2f}s")
+            logger.info("📼 Captured audio segment: %.2fs", len(full_audio) / sample_rate)
             return full_audio
             
         except Exception as e:
@@ -213,29 +342,64 @@ class AudioVideoOutput:
             return None
     
     def save_captured_audio(self, audio_data: np.ndarray, 
-                           filename: Optional[str] = None) -> Optional[str]:
+                           filename: Optional[str] = None,
+                           blocking: bool = False) -> Optional[str]:
         """Save captured audio to file.
         
+        By default the file is written on a background thread and the path
+        is returned immediately; call wait_for_saves() before reading it.
+        
         Args:
             audio_data: Audio data to save
             filename: Output filename (auto-generated if None)
+            blocking: Write the file before returning
             
         Returns:
-            Path to saved file or None if failed
+            Path of the (possibly still being written) file or None if failed
         """
         try:
             if audio_data is None or audio_data.size == 0:
                 logger.error("No audio data to save")
                 return None
             
-            filepath = self.audio_capture.save_audio_to_wav(audio_data, filename)
-            logger.info(f"💾 Audio saved to: {filepath}")
+            filepath = filename or self.audio_capture.default_wav_path()
+            
+            if blocking:
+                self._write_wav(audio_data, filepath)
+            else:
+                # Copy so the caller may reuse its buffer while the write is pending
+                self._save_exec.submit(self._write_wav, audio_data.copy(), filepath)
+            
             return filepath
             
         except Exception as e:
             logger.error(f"❌ Error saving audio: {e}")
             return None
     
+    def _write_wav(self, audio_data: np.ndarray, filepath: str) -> None:
+        """Write one WAV file, logging rather than raising on failure."""
+        try:
+            self.audio_capture.save_audio_to_wav(audio_data, filepath)
+            logger.info("💾 Audio saved to: %s", filepath)
+        except Exception as e:
+            logger.error(f"❌ Error saving audio: {e}")
+    
+    def wait_for_saves(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued WAV write has finished.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+            
+        Returns:
+            True if all writes finished, False on timeout
+        """
+        try:
+            # The single worker runs tasks in order, so a no-op marks the end of the queue
+            self._save_exec.submit(lambda: None).result(timeout)
+            return True
+        except FutureTimeoutError:
+            return False
+    
     def get_vad_stats(self) -> dict:
         """Get voice activity detection statistics.
         
@@ -301,6 +465,12 @@ class AudioVideoOutput:
         except Exception as e:
             logger.error(f"Error clearing audio buffer: {e}")
     
+    def close(self) -> None:
+        """Stop capture, finish queued WAV writes and release the save thread."""
+        if self.capturing:
+            self.stop_audio_capture()
+        self._save_exec.shutdown(wait=True)
+    
     def __enter__(self):
         """Context manager entry."""
         self.start_audio_capture()
@@ -308,4 +478,5 @@ class AudioVideoOutput:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.stop_audio_capture() 
\ No newline at end of file
+        self.stop_audio_capture()
+        self.wait_for_saves()
\ No newline at end of file
@@ -7,6 +7,9 @@ from pathlib import Path
 class BrowserAutomationAgent(ABC):
     """Abstract base class for browser-based meeting automation agents."""
     
+    # No instance dict of its own, so subclasses may declare __slots__
+    __slots__ = ()
+    
     @abstractmethod
     def join_meeting(self, url: str, display_name: Optional[str] = None) -> bool:
         """Join a meeting with the given URL.
@@ -116,6 +119,36 @@ class BrowserAutomationAgent(ABC):
         pass
     
     # Optional methods that can be overridden
+    def launch(self) -> bool:
+        """Start the browser without joining a meeting (used to pre-warm agents).
+        
+        Returns:
+            True if the browser is ready
+        """
+        # Default implementation - can be overridden
+        return True
+    
+    def reset(self) -> bool:
+        """Return the agent to an idle state so it can join another meeting.
+        
+        Returns:
+            True if the agent can be reused
+        """
+        # Default implementation - can be overridden
+        return False
+    
+    def wait_for_mic_ready(self, timeout: float = 0.5) -> Optional[bool]:
+        """Wait until the microphone is live after being enabled.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True when ready, False on timeout, None if readiness cannot be detected
+        """
+        # Default implementation - can be overridden
+        return None
+    
     def inject_audio_file(self, file_path: Path) -> bool:
         """Inject audio from a file into the meeting.
         
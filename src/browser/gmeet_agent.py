@@ -1,10 +1,13 @@
 """Google Meet specific browser automation agent."""
 
+import threading
 import time
-from typing import Optional, Dict, Any, List
+import weakref
+from typing import Optional, Dict, Any, List, Tuple, ClassVar, Callable
 from pathlib import Path
 
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Locator, Page, Playwright
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 
 from .base_interface import BrowserAutomationAgent
 
@@ -24,6 +27,219 @@ logger = setup_logger("browser.gmeet")
 class GMeetAgent(BrowserAutomationAgent):
     """Google Meet implementation of browser automation agent."""
     
+    # Controls shown while the microphone is on
+    MIC_ON_SELECTORS = (
+        "[aria-label*='Turn off microphone']", 
+        "[aria-label*='Mute']"
+    )
+    
+    MIC_ON_SELECTOR = ", ".join(f"{s}:visible" for s in MIC_ON_SELECTORS)
+    
+    # Media state indicators, all checked by MEDIA_STATE_SCRIPT in one call
+    MEDIA_STATE_SELECTORS = {
+        "micMuted": [
+            "[aria-label*='Turn on microphone']",
+            "[aria-label*='Unmute']",
+            ".wuLiOc"  # Muted state class
+        ],
+        "micOn": list(MIC_ON_SELECTORS),
+        "cameraOff": [
+            "[aria-label*='Turn on camera']",
+            "[aria-label*='camera off']"
+        ],
+        "cameraOn": [
+            "[aria-label*='Turn off camera']",
+            "[aria-label*='camera on']"
+        ]
+    }
+    
+    MEDIA_STATE_SCRIPT = """
+    (sel) => {
+        const shown = (s) => Array.from(document.querySelectorAll(s))
+            .some((el) => el.getClientRects().length > 0);
+        const any = (list) => list.some(shown);
+        return {
+            mic_muted: any(sel.micMuted),
+            mic_on: any(sel.micOn),
+            camera_off: any(sel.cameraOff),
+            camera_on: any(sel.cameraOn)
+        };
+    }
+    """
+    
+    # Any join control; the generic Google button class is left out since
+    # a union matches in document order rather than by priority
+    JOIN_BUTTON_SELECTOR = (
+        ":text('Join now'), "
+        ":text('Ask to join'), "
+        "[aria-label*='Join'], "
+        "button:has-text('Join'), "
+        "[jsname='Qx7uuf']"
+    )
+    
+    # The leave control only exists once we are actually in the call
+    IN_CALL_SELECTOR = "[aria-label*='Leave call'], [aria-label*='End call']"
+    
+    # In-call controls, in priority order (plain CSS, matched inside the page by _resolve)
+    LEAVE_SELECTORS = (
+        "[aria-label*='Leave call']",
+        "[aria-label*='End call']", 
+        "button[data-call-leave]",
+        ".DPvwYc",  # Google Meet leave button class
+    )
+    
+    MIC_TOGGLE_SELECTORS = (
+        "[aria-label*='microphone' i]",
+        "[data-tooltip*='microphone' i]",
+        "[data-tooltip*='mute' i]",  # Mute / Unmute
+        "[aria-label*='mute' i]",
+        "div[role='button'][aria-label*='Turn']",
+    )
+    
+    CAMERA_TOGGLE_SELECTORS = (
+        "[aria-label*='camera' i]",
+        "[data-tooltip*='camera' i]",
+    )
+    
+    CHAT_BUTTON_SELECTORS = (
+        "[aria-label*='chat' i]",
+        "button[data-tooltip*='Chat']"
+    )
+    
+    # Index of the first selector with a visible match, found in one DOM pass
+    FIRST_VISIBLE_SCRIPT = """
+    (selectors) => selectors.findIndex((selector) => {
+        try {
+            return Array.from(document.querySelectorAll(selector))
+                .some((el) => el.getClientRects().length > 0);
+        } catch (e) {
+            return false;
+        }
+    })
+    """
+    
+    CHAT_INPUT_SELECTORS = (
+        "textarea[placeholder*='message']",
+        "input[placeholder*='message']",
+        ".chat-input",
+        "[aria-label*='Type a message']"
+    )
+    CHAT_INPUT_SELECTOR = ", ".join(f"{s}:visible" for s in CHAT_INPUT_SELECTORS)
+    
+    # Pre-join screen controls
+    NAME_INPUT_SELECTORS = (
+        "input[placeholder*='name']",
+        "input[aria-label*='name']",
+        "input[type='text']"
+    )
+    
+    CAMERA_OFF_SELECTORS = (
+        "[aria-label*='Turn off camera']",
+        "button[aria-label*='camera off']"
+    )
+    
+    MIC_MUTE_SELECTORS = (
+        "[aria-label*='Turn off microphone']",
+        "button[aria-label*='microphone off']"
+    )
+    MEDIA_SETUP_SELECTOR = ", ".join(CAMERA_OFF_SELECTORS + MIC_MUTE_SELECTORS)
+    
+    # Visible-only unions so each step-by-step pre-join action is one call
+    NAME_INPUT_SELECTOR = ", ".join(f"{s}:visible" for s in NAME_INPUT_SELECTORS)
+    CAMERA_OFF_SELECTOR = ", ".join(f"{s}:visible" for s in CAMERA_OFF_SELECTORS)
+    MIC_MUTE_SELECTOR = ", ".join(f"{s}:visible" for s in MIC_MUTE_SELECTORS)
+    
+    # Plain CSS / visible text only, since these are resolved inside the page
+    JOIN_BUTTON_SELECTORS = (
+        "[aria-label*='Join']",
+        "[jsname='Qx7uuf']"
+    )
+    JOIN_BUTTON_LABELS = ("Join now", "Ask to join")
+    
+    # Runs the whole pre-join sequence in one evaluate round-trip
+    PREJOIN_SCRIPT = """
+    (opts) => {
+        const visible = (el) => !!el && el.getClientRects().length > 0;
+        const enabled = (el) => !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+        const find = (selectors) => {
+            for (const selector of selectors) {
+                const el = Array.from(document.querySelectorAll(selector)).find(visible);
+                if (el) return el;
+            }
+            return null;
+        };
+        const result = {name_set: false, camera_off: false, mic_muted: false, joined: false};
+        
+        if (opts.name) {
+            const input = find(opts.nameSelectors);
+            if (input) {
+                const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+                setter.call(input, opts.name);
+                input.dispatchEvent(new Event('input', {bubbles: true}));
+                result.name_set = true;
+            }
+        }
+        
+        const camera = find(opts.cameraSelectors);
+        if (camera) { camera.click(); result.camera_off = true; }
+        
+        const mic = find(opts.micSelectors);
+        if (mic) { mic.click(); result.mic_muted = true; }
+        
+        let join = Array.from(document.querySelectorAll('button, [role="button"]'))
+            .find((el) => visible(el) && opts.joinLabels.includes(el.textContent.trim()));
+        join = join || find(opts.joinSelectors);
+        // A guest "Ask to join" stays disabled until the name input registers;
+        // leave that case to the caller's actionability-waiting click
+        if (join && enabled(join)) { join.click(); result.joined = true; }
+        
+        return result;
+    }
+    """
+    
+    # Chromium switches for every launch; fake media devices are added for profile-less browsers
+    BROWSER_ARGS = (
+        "--use-fake-ui-for-media-stream",  # Auto-approve media permissions
+        "--autoplay-policy=no-user-gesture-required",  # Allow autoplay
+        "--disable-blink-features=AutomationControlled",  # Hide automation
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-features=Translate,MediaRouter,OptimizationHints,InterestFeedContentSuggestions",
+    )
+    
+    # Seconds a pushed or probed media state is trusted before the page is probed again
+    UI_STATE_MAX_AGE = 1.0
+    
+    # Installed on every page: pushes mic/camera/in-call state to Python whenever it changes
+    UI_STATE_SCRIPT = """
+    (() => {
+        if (window.top !== window) return;
+        const has = (s) => !!document.querySelector(s);
+        const state = (on, off) => has(on) ? true : (has(off) ? false : null);
+        let last = "";
+        const report = () => {
+            const current = {
+                mic_on: state("[aria-label*='Turn off microphone']", "[aria-label*='Turn on microphone']"),
+                camera_on: state("[aria-label*='Turn off camera']", "[aria-label*='Turn on camera']"),
+                in_call: has("[aria-label*='Leave call']")
+            };
+            const key = JSON.stringify(current);
+            if (key !== last && window._gmeetState) {
+                last = key;
+                window._gmeetState(current);
+            }
+        };
+        new MutationObserver(report).observe(document, {
+            subtree: true, childList: true, attributes: true, attributeFilter: ["aria-label"]
+        });
+    })();
+    """
+    
+    # Browsers shared by every profile-less agent, keyed by (headless, executable)
+    _shared_playwright: ClassVar[Optional[Playwright]] = None
+    _shared_browsers: ClassVar[Dict[tuple, Browser]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, 
                  headless: bool = False,
                  chrome_profile_path: Optional[str] = None,
@@ -41,133 +257,289 @@ class GMeetAgent(BrowserAutomationAgent):
         self.chrome_profile_path = chrome_profile_path or Config.CHROME_PROFILE_PATH
         self.use_chrome_profile = use_chrome_profile and Config.USE_CHROME_PROFILE
         self.chrome_executable_path = chrome_executable_path or Config.CHROME_EXECUTABLE_PATH
+        self._profile_path: Optional[Path] = None  # Resolved on first persistent launch
         
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
+        self.browser: Optional[Browser] = None  # Shared browser (no profile)
+        self.context: Optional[BrowserContext] = None  # This agent's context in the shared browser
         self.browser_context = None  # For persistent context (profiles)
         self.page: Optional[Page] = None
         self.meeting_url: Optional[str] = None
         self.in_meeting = False
         
-        logger.info(f"🌐 GMeet Agent initialized (headless={headless}, profile={self.use_chrome_profile})")
+        # Chat input resolved on the first send, reused until the meeting ends
+        self._chat_input: Optional[Locator] = None
+        
+        # Locator of the selector that matched last time, per control; cleared on navigation
+        self._sel_cache: Dict[str, Locator] = {}
+        
+        # Last state pushed by UI_STATE_SCRIPT (empty until the page reports)
+        self._ui_state: Dict[str, Optional[bool]] = {}
+        self._ui_state_time = 0.0
+        
+        logger.info("🌐 GMeet Agent initialized (headless=%s, profile=%s)", headless, self.use_chrome_profile)
     
-    def join_meeting(self, url: str, display_name: Optional[str] = None) -> bool:
-        """Join a Google Meet meeting.
+    @property
+    def uses_shared_browser(self) -> bool:
+        """Whether this agent runs in a context of the shared browser (no persistent profile)."""
+        return not (self.use_chrome_profile and not self.headless)
+    
+    @classmethod
+    def _ensure_shared_browser(cls, launch_options: Dict[str, Any]) -> Browser:
+        """Launch the browser shared by profile-less agents with these options, once.
+        
+        Must be called from the thread that runs every shared-browser agent,
+        since Playwright's sync API is bound to the thread that started it.
+        """
+        key = (launch_options["headless"], launch_options.get("executable_path"))
+        with cls._shared_lock:
+            browser = cls._shared_browsers.get(key)
+            if browser is not None and browser.is_connected():
+                return browser
+            
+            if cls._shared_playwright is None:
+                cls._shared_playwright = sync_playwright().start()
+            
+            browser = cls._shared_playwright.chromium.launch(**launch_options)
+            cls._shared_browsers[key] = browser
+            logger.info("🌐 Launched shared browser (headless=%s)", key[0])
+            return browser
+    
+    @classmethod
+    def close_shared_browsers(cls) -> None:
+        """Close the shared browsers and their Playwright instance (on the browser thread)."""
+        with cls._shared_lock:
+            for browser in cls._shared_browsers.values():
+                try:
+                    browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing shared browser: {e}")
+            cls._shared_browsers.clear()
+            
+            if cls._shared_playwright is not None:
+                cls._shared_playwright.stop()
+                cls._shared_playwright = None
+    
+    def _attach_page(self, page: Page) -> None:
+        """Use page for automation and drop cached locators whenever it navigates.
+        
+        Playwright keeps the page and its handlers alive, so the handlers only
+        hold weak references to the agent. Pages and contexts are not closed
+        on garbage collection: the sync API only works on the browser thread,
+        so close() must be called there to release them.
+        """
+        self.page = page
+        self._sel_cache.clear()
+        self._ui_state = {}
+        self._ui_state_time = 0.0
+        agent_ref = weakref.ref(self)
+        
+        def on_navigated(frame) -> None:
+            agent = agent_ref()
+            if agent is not None and frame == page.main_frame:
+                agent._sel_cache.clear()
+        
+        def on_ui_state(source, state) -> None:
+            agent = agent_ref()
+            if agent is not None:
+                agent._on_ui_state(state)
+        
+        page.on("framenavigated", on_navigated)
+        
+        # State pushes arrive on this agent's thread while Playwright services its calls
+        try:
+            page.expose_binding("_gmeetState", on_ui_state)
+            page.add_init_script(self.UI_STATE_SCRIPT)
+        except Exception as e:
+            logger.debug("UI state observer not installed, probing instead: %s", e)
+    
+    def _on_ui_state(self, state: Dict[str, Optional[bool]]) -> None:
+        """Record a state push from the page and track joins and remote hang-ups."""
+        was_in_call = self._ui_state.get("in_call")
+        self._ui_state = state
+        self._ui_state_time = time.monotonic()
+        
+        if state.get("in_call"):
+            self.in_meeting = True
+        elif was_in_call:
+            # Only a call that was seen ending counts; an "Ask to join" lobby has no leave button yet
+            self.in_meeting = False
+    
+    def _resolve(self, key: str, selectors: Tuple[str, ...]) -> Optional[Locator]:
+        """Find the visible control for key, trying the last matching selector first.
         
         Args:
-            url: Google Meet URL
-            display_name: Name to display in meeting
+            key: Cache key naming the control
+            selectors: Candidate plain-CSS selectors in priority order
             
         Returns:
-            True if successfully joined
+            Locator of the first visible match, or None
+        """
+        cached = self._sel_cache.get(key)
+        if cached is not None:
+            try:
+                if cached.is_visible():
+                    return cached
+            except Exception:
+                pass
+            del self._sel_cache[key]
+        
+        try:
+            index = self.page.evaluate(self.FIRST_VISIBLE_SCRIPT, list(selectors))
+        except Exception:
+            return None
+        if index < 0:
+            return None
+        
+        locator = self.page.locator(f"{selectors[index]}:visible").first
+        self._sel_cache[key] = locator
+        return locator
+    
+    def launch(self) -> bool:
+        """Start the browser (or a context in the shared one) and a page without joining a meeting.
+        
+        Returns:
+            True if the browser page is ready
         """
         try:
-            logger.info(f"🚀 Joining Google Meet: {url}")
+            browser_args = list(self.BROWSER_ARGS)
+            
+            launch_options = {
+                "headless": self.headless,
+                "args": browser_args,
+                "ignore_default_args": ["--enable-automation"]  # No automation infobar
+            }
+            
+            # Add Chrome executable path if specified
+            if self.chrome_executable_path:
+                launch_options["executable_path"] = self.chrome_executable_path
+            
+            if self.uses_shared_browser:
+                # Profile-less agents share one browser process; each gets an
+                # isolated context, which takes milliseconds instead of a launch
+                if not self.browser:
+                    # Use fake devices for testing when no profile
+                    browser_args.append("--use-fake-device-for-media-stream")
+                    self.browser = self._ensure_shared_browser(launch_options)
+                
+                if not self.context:
+                    self.context = self.browser.new_context(permissions=["camera", "microphone"])
+                
+                if not self.page:
+                    self._attach_page(self.context.new_page())
+                
+                return True
             
-            # Start Playwright if not already started
+            # Persistent profile: this agent owns its Playwright instance and browser
             if not self.playwright:
                 self.playwright = sync_playwright().start()
             
-            # Launch browser with appropriate flags for media access
-            if not self.browser:
-                browser_args = [
-                    "--use-fake-ui-for-media-stream",  # Auto-approve media permissions
-                    "--disable-features=Translate",   # Disable translation bar
-                    "--disable-web-security",         # Allow media access
-                    "--allow-running-insecure-content",
-                    "--autoplay-policy=no-user-gesture-required",  # Allow autoplay
-                    "--disable-blink-features=AutomationControlled",  # Hide automation
-                    "--disable-extensions-except=",  # Disable extensions except allowed ones
-                    "--disable-plugins-discovery",   # Disable plugin discovery
-                ]
+            if not self.browser_context:
+                if self._profile_path is None:
+                    # Resolve and create the profile directory once per agent
+                    self._profile_path = Path(self.chrome_profile_path).resolve()
+                    self._profile_path.mkdir(parents=True, exist_ok=True)
                 
-                # Handle Chrome profile vs regular browser launch
-                if self.use_chrome_profile and not self.headless:
-                    # Create profile directory if it doesn't exist
-                    profile_path = Path(self.chrome_profile_path).resolve()
-                    profile_path.mkdir(parents=True, exist_ok=True)
-                    
-                    # Add profile-specific args (without --user-data-dir)
-                    browser_args.extend([
-                        "--no-first-run",
-                        "--no-default-browser-check",
-                    ])
-                    
-                    # Use launch_persistent_context for profiles
-                    launch_options = {
-                        "headless": self.headless,
-                        "args": browser_args
-                    }
-                    
-                    # Add Chrome executable path if specified
-                    if self.chrome_executable_path:
-                        launch_options["executable_path"] = self.chrome_executable_path
-                        logger.info(f"🔧 Using Chrome executable: {self.chrome_executable_path}")
-                    
-                    logger.info(f"📁 Using Chrome profile: {profile_path}")
-                    
-                    # Launch persistent context with profile
-                    self.browser_context = self.playwright.chromium.launch_persistent_context(
-                        user_data_dir=str(profile_path),
-                        **launch_options
-                    )
-                    # Note: with persistent context, we use context.pages[0] instead of browser.new_page()
-                    
-                else:
-                    # Use fake devices for testing when no profile
-                    browser_args.append("--use-fake-device-for-media-stream")
-                    
-                    launch_options = {
-                        "headless": self.headless,
-                        "args": browser_args
-                    }
-                    
-                    # Add Chrome executable path if specified
-                    if self.chrome_executable_path:
-                        launch_options["executable_path"] = self.chrome_executable_path
-                        logger.info(f"🔧 Using Chrome executable: {self.chrome_executable_path}")
-                    
-                    self.browser = self.playwright.chromium.launch(**launch_options)
+                if self.chrome_executable_path:
+                    logger.info("🔧 Using Chrome executable: %s", self.chrome_executable_path)
+                logger.info("📁 Using Chrome profile: %s", self._profile_path)
+                
+                # Launch persistent context with profile; media permissions
+                # are granted with the context rather than per page
+                self.browser_context = self.playwright.chromium.launch_persistent_context(
+                    user_data_dir=str(self._profile_path),
+                    permissions=["camera", "microphone"],
+                    **launch_options
+                )
             
-            # Create new page if needed
             if not self.page:
-                if self.browser_context:
-                    # Using persistent context (profile) - get existing page or create new one
-                    if self.browser_context.pages:
-                        self.page = self.browser_context.pages[0]
-                    else:
-                        self.page = self.browser_context.new_page()
-                    
-                    # Grant media permissions
-                    self.browser_context.grant_permissions(["camera", "microphone"])
+                # Using persistent context (profile) - get existing page or create new one
+                if self.browser_context.pages:
+                    self._attach_page(self.browser_context.pages[0])
                 else:
-                    # Using regular browser
-                    if not self.browser:
-                        logger.error("Browser not available for creating new page")
-                        return False
-                    self.page = self.browser.new_page()
-                    
-                    # Grant media permissions
-                    context = self.page.context
-                    context.grant_permissions(["camera", "microphone"])
+                    self._attach_page(self.browser_context.new_page())
             
-            # Navigate to meeting URL
-            self.meeting_url = url
-            self.page.goto(url)
+            return True
             
-            # Wait for page to load
-            logger.info("⏳ Waiting for Google Meet to load...")
-            self.page.wait_for_timeout(3000)
+        except Exception as e:
+            logger.error(f"❌ Error launching browser: {e}")
+            return False
+    
+    def reset(self) -> bool:
+        """Leave any meeting and park the page on about:blank for reuse.
+        
+        Returns:
+            True if the agent can be reused for another meeting
+        """
+        try:
+            if self.in_meeting:
+                self.leave_meeting()
             
-            # Set display name if provided
-            if display_name:
-                self._set_display_name(display_name)
+            if not self.page or self.page.is_closed():
+                self.page = None
+                return self.launch()
+            
+            # Drop pages opened during the meeting and, without a persistent
+            # profile (whose login must survive), the meeting's cookies
+            context = self.page.context
+            for page in context.pages:
+                if page is not self.page:
+                    page.close()
+            if self.context:
+                context.clear_cookies()
+            
+            self.page.goto("about:blank")
+            self._chat_input = None
+            self._ui_state = {}
+            self._ui_state_time = 0.0
+            self.meeting_url = None
+            self.in_meeting = False
+            return True
             
-            # Handle camera and microphone setup
-            self._setup_media_devices()
+        except Exception as e:
+            logger.warning(f"Could not reset GMeet Agent for reuse: {e}")
+            return False
+    
+    def join_meeting(self, url: str, display_name: Optional[str] = None) -> bool:
+        """Join a Google Meet meeting.
+        
+        Args:
+            url: Google Meet URL
+            display_name: Name to display in meeting
+            
+        Returns:
+            True if successfully joined
+        """
+        try:
+            logger.info("🚀 Joining Google Meet: %s", url)
+            
+            if not self.launch():
+                return False
+            
+            # Navigate to meeting URL
+            self.meeting_url = url
+            self.page.goto(url, wait_until="domcontentloaded")
             
-            # Join the meeting
-            success = self._click_join_button()
+            # Wait for the pre-join screen to render its join control
+            logger.info("⏳ Waiting for Google Meet to load...")
+            try:
+                self.page.locator(self.JOIN_BUTTON_SELECTOR).first.wait_for(state="visible", timeout=10000)
+            except PlaywrightTimeoutError:
+                logger.warning("Join button not visible yet, continuing")
+            
+            # Name, media and join in a single round-trip; fall back to
+            # per-action steps if the page layout doesn't match
+            success = self._prejoin_batched(display_name)
+            if not success:
+                # Set display name if provided
+                if display_name:
+                    self._set_display_name(display_name)
+                
+                # Handle camera and microphone setup
+                self._setup_media_devices()
+                
+                # Join the meeting
+                success = self._click_join_button()
             
             if success:
                 self.in_meeting = True
@@ -179,6 +551,8 @@ class GMeetAgent(BrowserAutomationAgent):
                 
         except Exception as e:
             logger.error(f"❌ Error joining meeting: {e}")
+            # Don't leave a half-joined page and its context holding browser memory
+            self.close()
             return False
     
     def leave_meeting(self) -> bool:
@@ -189,24 +563,18 @@ class GMeetAgent(BrowserAutomationAgent):
                 return True
             
             logger.info("👋 Leaving Google Meet...")
+            self._chat_input = None
             
             # Try to find and click leave button
-            leave_selectors = [
-                "[aria-label*='Leave call']",
-                "[aria-label*='End call']", 
-                "button[data-call-leave]",
-                ".DPvwYc",  # Google Meet leave button class
-            ]
-            
-            for selector in leave_selectors:
+            leave_button = self._resolve("leave", self.LEAVE_SELECTORS)
+            if leave_button is not None:
                 try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info("✅ Successfully left meeting")
-                        self.in_meeting = False
-                        return True
+                    leave_button.click()
+                    logger.info("✅ Successfully left meeting")
+                    self.in_meeting = False
+                    return True
                 except Exception:
-                    continue
+                    pass
             
             # If we can't find leave button, just close the page
             logger.warning("Could not find leave button, closing page")
@@ -225,31 +593,21 @@ class GMeetAgent(BrowserAutomationAgent):
                 logger.warning("Not in a meeting")
                 return False
             
-            # Google Meet microphone button selectors
-            mic_selectors = [
-                "[aria-label*='microphone']",
-                "[aria-label*='Microphone']", 
-                "[data-tooltip*='microphone']",
-                "div[role='button'][aria-label*='Turn']",
-                "[data-tooltip*='Mute']",
-                "[data-tooltip*='Unmute']",
-                "[aria-label*='Mute']",
-                "[aria-label*='Unmute']",
-            ]
-            
-            current_state = self.is_microphone_enabled()
+            # Probe rather than trust pushed state, which may not have been delivered yet
+            current_state = self._probe_microphone()
             if current_state == enabled:
-                logger.info(f"Microphone already {'enabled' if enabled else 'disabled'}")
+                logger.info("Microphone already %s", 'enabled' if enabled else 'disabled')
                 return True
             
-            for selector in mic_selectors:
+            mic_button = self._resolve("mic_toggle", self.MIC_TOGGLE_SELECTORS)
+            if mic_button is not None:
                 try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info(f"🎤 Microphone {'enabled' if enabled else 'disabled'}")
-                        return True
+                    mic_button.click()
+                    self._ui_state_time = 0.0  # The push for this click may not have arrived yet
+                    logger.info("🎤 Microphone %s", 'enabled' if enabled else 'disabled')
+                    return True
                 except Exception:
-                    continue
+                    pass
             
             # Don't treat this as a critical error - log as warning and return False
             logger.warning("Could not find microphone button - continuing without mic control")
@@ -266,27 +624,20 @@ class GMeetAgent(BrowserAutomationAgent):
                 logger.warning("Not in a meeting")
                 return False
             
-            # Google Meet camera button selectors
-            camera_selectors = [
-                "[aria-label*='camera']",
-                "[aria-label*='Camera']",
-                "[data-tooltip*='camera']",
-                "div[role='button'][aria-label*='Turn'][aria-label*='camera']",
-            ]
-            
-            current_state = self.is_camera_enabled()
+            current_state = self._probe_camera()
             if current_state == enabled:
-                logger.info(f"Camera already {'enabled' if enabled else 'disabled'}")
+                logger.info("Camera already %s", 'enabled' if enabled else 'disabled')
                 return True
             
-            for selector in camera_selectors:
+            camera_button = self._resolve("camera_toggle", self.CAMERA_TOGGLE_SELECTORS)
+            if camera_button is not None:
                 try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info(f"📹 Camera {'enabled' if enabled else 'disabled'}")
-                        return True
+                    camera_button.click()
+                    self._ui_state_time = 0.0
+                    logger.info("📹 Camera %s", 'enabled' if enabled else 'disabled')
+                    return True
                 except Exception:
-                    continue
+                    pass
             
             logger.error("Could not find camera button")
             return False
@@ -295,65 +646,89 @@ class GMeetAgent(BrowserAutomationAgent):
             logger.error(f"❌ Error toggling camera: {e}")
             return False
     
+    def get_media_state(self) -> Dict[str, bool]:
+        """Read every mic/camera indicator in a single evaluate round-trip.
+        
+        Returns:
+            Dictionary with mic_muted, mic_on, camera_off and camera_on flags
+            (empty if the page is unavailable)
+        """
+        if not self.page:
+            return {}
+        
+        try:
+            return self.page.evaluate(self.MEDIA_STATE_SCRIPT, self.MEDIA_STATE_SELECTORS)
+        except Exception as e:
+            logger.debug("Media state probe failed: %s", e)
+            return {}
+    
     def is_microphone_enabled(self) -> Optional[bool]:
-        """Check if microphone is enabled."""
+        """Check if microphone is enabled.
+        
+        Pushed UI state is only delivered while a Playwright call is running,
+        so it can lag a toggle or a host mute; it is trusted for
+        UI_STATE_MAX_AGE seconds and the page is probed once it is older.
+        """
+        return self._media_state("mic_on", self._probe_microphone)
+    
+    def _media_state(self, key: str, probe: Callable[[], Optional[bool]]) -> Optional[bool]:
+        """Return the pushed state for ``key`` while fresh, otherwise probe the page."""
+        state = self._ui_state.get(key)
+        if state is not None and time.monotonic() - self._ui_state_time < self.UI_STATE_MAX_AGE:
+            return state
+        
+        probed = probe()
+        return state if probed is None else probed
+    
+    def _probe_microphone(self) -> Optional[bool]:
+        """Read microphone state from the page."""
         try:
             if not self.page:
                 return None
             
             # Look for muted/unmuted indicators
-            muted_selectors = [
-                "[aria-label*='Turn on microphone']",
-                "[aria-label*='Unmute']",
-                ".wuLiOc"  # Muted state class
-            ]
-            
-            unmuted_selectors = [
-                "[aria-label*='Turn off microphone']", 
-                "[aria-label*='Mute']"
-            ]
-            
-            # Check if muted
-            for selector in muted_selectors:
-                if self.page.is_visible(selector):
-                    return False
-            
-            # Check if unmuted
-            for selector in unmuted_selectors:
-                if self.page.is_visible(selector):
-                    return True
+            state = self.get_media_state()
+            if state.get("mic_muted"):
+                return False
+            
+            if state.get("mic_on"):
+                return True
             
             return None
             
         except Exception:
             return None
     
+    def wait_for_mic_ready(self, timeout: float = 0.5) -> Optional[bool]:
+        """Wait for the mic-on control to appear instead of sleeping a fixed time."""
+        if not self.page or not self.in_meeting:
+            return None
+        
+        try:
+            self.page.wait_for_selector(self.MIC_ON_SELECTOR,
+                                        state="visible",
+                                        timeout=timeout * 1000)
+            return True
+        except Exception:
+            return False
+    
     def is_camera_enabled(self) -> Optional[bool]:
-        """Check if camera is enabled."""
+        """Check if camera is enabled (fresh pushed state first, as for the microphone)."""
+        return self._media_state("camera_on", self._probe_camera)
+    
+    def _probe_camera(self) -> Optional[bool]:
+        """Read camera state from the page."""
         try:
             if not self.page:
                 return None
             
             # Look for camera on/off indicators
-            off_selectors = [
-                "[aria-label*='Turn on camera']",
-                "[aria-label*='camera off']"
-            ]
-            
-            on_selectors = [
-                "[aria-label*='Turn off camera']",
-                "[aria-label*='camera on']"
-            ]
-            
-            # Check if camera is off
-            for selector in off_selectors:
-                if self.page.is_visible(selector):
-                    return False
-            
-            # Check if camera is on
-            for selector in on_selectors:
-                if self.page.is_visible(selector):
-                    return True
+            state = self.get_media_state()
+            if state.get("camera_off"):
+                return False
+            
+            if state.get("camera_on"):
+                return True
             
             return None
             
@@ -397,45 +772,42 @@ class GMeetAgent(BrowserAutomationAgent):
                 logger.warning("Not in a meeting")
                 return False
             
+            # Chat stays open after the first send, so go straight to the input;
+            # a short fill timeout means the panel was closed and is reopened below
+            if self._chat_input is not None:
+                try:
+                    self._chat_input.fill(message, timeout=1000)
+                    self._chat_input.press("Enter")
+                    logger.info("💬 Sent chat message: %s...", message[:50])
+                    return True
+                except PlaywrightError:
+                    self._chat_input = None
+            
             # Open chat if not already open
-            chat_button_selectors = [
-                "[aria-label*='Chat']",
-                "[aria-label*='chat']",
-                "button[data-tooltip*='Chat']"
-            ]
-            
-            # Find and click chat button
-            for selector in chat_button_selectors:
+            chat_button = self._resolve("chat_button", self.CHAT_BUTTON_SELECTORS)
+            if chat_button is not None:
                 try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        break
+                    chat_button.click()
                 except Exception:
-                    continue
+                    pass
             
             # Wait for chat to open
-            self.page.wait_for_timeout(1000)
-            
-            # Find chat input
-            chat_input_selectors = [
-                "textarea[placeholder*='message']",
-                "input[placeholder*='message']",
-                ".chat-input",
-                "[aria-label*='Type a message']"
-            ]
+            try:
+                self.page.wait_for_selector(self.CHAT_INPUT_SELECTOR, state="visible", timeout=3000)
+            except PlaywrightTimeoutError:
+                pass
             
-            for selector in chat_input_selectors:
-                try:
-                    if self.page.is_visible(selector):
-                        self.page.fill(selector, message)
-                        self.page.press(selector, "Enter")
-                        logger.info(f"💬 Sent chat message: {message[:50]}...")
-                        return True
-                except Exception:
-                    continue
+            chat_input = self.page.locator(self.CHAT_INPUT_SELECTOR).first
+            try:
+                chat_input.fill(message, timeout=1000)
+                chat_input.press("Enter")
+            except PlaywrightError:
+                logger.error("Could not find chat input")
+                return False
             
-            logger.error("Could not find chat input")
-            return False
+            self._chat_input = chat_input
+            logger.info("💬 Sent chat message: %s...", message[:50])
+            return True
             
         except Exception as e:
             logger.error(f"❌ Error sending chat message: {e}")
@@ -451,9 +823,15 @@ class GMeetAgent(BrowserAutomationAgent):
                 self.page.close()
                 self.page = None
             
-            if self.browser:
-                self.browser.close()
-                self.browser = None
+            # Only this agent's context; the shared browser stays up for others
+            if self.context:
+                self.context.close()
+                self.context = None
+            self.browser = None
+            
+            if self.browser_context:
+                self.browser_context.close()
+                self.browser_context = None
             
             if self.playwright:
                 self.playwright.stop()
@@ -464,6 +842,60 @@ class GMeetAgent(BrowserAutomationAgent):
         except Exception as e:
             logger.error(f"Error closing GMeet Agent: {e}")
     
+    def _prejoin_batched(self, display_name: Optional[str]) -> bool:
+        """Set the name, turn camera and mic off and click join via one evaluate call.
+        
+        Returns:
+            True if the join button was clicked; False if it was missing or
+            still disabled, so the step-by-step join should run
+        """
+        try:
+            result = self.page.evaluate(self.PREJOIN_SCRIPT, {
+                "name": display_name or "",
+                "nameSelectors": list(self.NAME_INPUT_SELECTORS),
+                "cameraSelectors": list(self.CAMERA_OFF_SELECTORS),
+                "micSelectors": list(self.MIC_MUTE_SELECTORS),
+                "joinSelectors": list(self.JOIN_BUTTON_SELECTORS),
+                "joinLabels": list(self.JOIN_BUTTON_LABELS),
+            })
+        except Exception as e:
+            logger.debug("Batched pre-join failed, using step-by-step join: %s", e)
+            return False
+        
+        logger.debug("Pre-join result: %s", result)
+        if not result:
+            return False
+        
+        if result.get("name_set"):
+            logger.info("📝 Set display name: %s", display_name)
+        if result.get("camera_off"):
+            logger.info("📹 Camera disabled for privacy")
+        if result.get("mic_muted"):
+            logger.info("🎤 Microphone muted initially")
+        
+        if not result.get("joined"):
+            return False
+        logger.info("🚪 Clicked join button")
+        
+        self._wait_for_call()
+        return True
+    
+    def _wait_for_call(self, timeout: float = 15.0) -> bool:
+        """Wait until the in-call controls appear after clicking join.
+        
+        Args:
+            timeout: Seconds to wait
+            
+        Returns:
+            True if the call UI appeared, False if still waiting (e.g. to be admitted)
+        """
+        try:
+            self.page.wait_for_selector(self.IN_CALL_SELECTOR, state="visible", timeout=timeout * 1000)
+            return True
+        except PlaywrightTimeoutError:
+            logger.warning("⏳ Call controls not visible yet, may be waiting to be admitted")
+            return False
+    
     def _set_display_name(self, name: str) -> None:
         """Set display name before joining."""
         try:
@@ -471,20 +903,11 @@ class GMeetAgent(BrowserAutomationAgent):
                 logger.warning("Page not available for setting display name")
                 return
                 
-            name_input_selectors = [
-                "input[placeholder*='name']",
-                "input[aria-label*='name']",
-                "input[type='text']"
-            ]
-            
-            for selector in name_input_selectors:
-                try:
-                    if self.page.is_visible(selector):
-                        self.page.fill(selector, name)
-                        logger.info(f"📝 Set display name: {name}")
-                        return
-                except Exception:
-                    continue
+            try:
+                self.page.locator(self.NAME_INPUT_SELECTOR).first.fill(name, timeout=1000)
+                logger.info("📝 Set display name: %s", name)
+            except PlaywrightTimeoutError:
+                pass
                     
         except Exception as e:
             logger.warning(f"Could not set display name: {e}")
@@ -497,37 +920,26 @@ class GMeetAgent(BrowserAutomationAgent):
                 return
                 
             # Wait for media setup UI
-            self.page.wait_for_timeout(2000)
+            try:
+                self.page.wait_for_selector(self.MEDIA_SETUP_SELECTOR,
+                                            state="visible",
+                                            timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
             
             # Disable camera by default (for privacy)
-            camera_off_selectors = [
-                "[aria-label*='Turn off camera']",
-                "button[aria-label*='camera off']"
-            ]
-            
-            for selector in camera_off_selectors:
-                try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info("📹 Camera disabled for privacy")
-                        break
-                except Exception:
-                    continue
+            try:
+                self.page.locator(self.CAMERA_OFF_SELECTOR).first.click(timeout=1000)
+                logger.info("📹 Camera disabled for privacy")
+            except PlaywrightTimeoutError:
+                pass
             
             # Ensure microphone is ready (but muted initially)
-            mic_mute_selectors = [
-                "[aria-label*='Turn off microphone']",
-                "button[aria-label*='microphone off']"
-            ]
-            
-            for selector in mic_mute_selectors:
-                try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info("🎤 Microphone muted initially")
-                        break
-                except Exception:
-                    continue
+            try:
+                self.page.locator(self.MIC_MUTE_SELECTOR).first.click(timeout=1000)
+                logger.info("🎤 Microphone muted initially")
+            except PlaywrightTimeoutError:
+                pass
                     
         except Exception as e:
             logger.warning(f"Error setting up media devices: {e}")
@@ -539,35 +951,21 @@ class GMeetAgent(BrowserAutomationAgent):
                 logger.error("Page not available for clicking join button")
                 return False
                 
-            # Wait for join button to be available
-            self.page.wait_for_timeout(2000)
-            
-            join_button_selectors = [
-                "text=Join now",
-                "text=Ask to join", 
-                "[aria-label*='Join']",
-                "button:has-text('Join')",
-                ".VfPpkd-LgbsSe",  # Google button class
-                "[jsname='Qx7uuf']"  # Google Meet join button
-            ]
-            
-            for selector in join_button_selectors:
-                try:
-                    if self.page.is_visible(selector):
-                        self.page.click(selector)
-                        logger.info("🚪 Clicked join button")
-                        
-                        # Wait for meeting to load
-                        self.page.wait_for_timeout(5000)
-                        return True
-                except Exception:
-                    continue
+            # Click waits for the join button to become actionable
+            try:
+                self.page.locator(self.JOIN_BUTTON_SELECTOR).first.click(timeout=10000)
+                logger.info("🚪 Clicked join button")
+                
+                self._wait_for_call()
+                return True
+            except PlaywrightTimeoutError:
+                pass
             
             # If no explicit join button, try Enter key
             try:
                 self.page.press("body", "Enter")
                 logger.info("⌨️  Pressed Enter to join")
-                self.page.wait_for_timeout(5000)
+                self._wait_for_call()
                 return True
             except Exception:
                 pass
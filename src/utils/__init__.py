@@ -1,6 +1,6 @@
 """Utility modules for Google Meet AI Agent."""
 
 from .config import Config
-from .logger import setup_logger, logger
+from .logger import setup_logger, get_logger
  
-__all__ = ['Config', 'setup_logger', 'logger'] 
\ No newline at end of file
+__all__ = ['Config', 'setup_logger', 'get_logger']
@@ -0,0 +1,70 @@
+"""Sample format conversion helpers shared by the audio and AI modules."""
+
+import numpy as np
+from typing import Optional
+
+INT16_MAX = 32767.0
+INT16_MIN = -32768.0
+
+# Reciprocal scale factors so normalization is a multiply, not a divide
+INT16_SCALE = np.float32(1.0 / INT16_MAX)
+INT32_SCALE = np.float32(2.0 ** -31)
+
+def int_to_float(audio_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert 16- or 32-bit PCM to float32 in [-1.0, 1.0].
+
+    The widening cast and scale happen in a single ufunc pass, which NumPy
+    dispatches to its vectorized (SIMD) int-to-float loops.
+
+    Args:
+        audio_data: Audio data as numpy array (float32 input is returned unchanged)
+        out: Optional preallocated float32 buffer with at least len(audio_data) samples
+
+    Returns:
+        Audio data as float32 numpy array (a view of out when provided)
+    """
+    if audio_data.dtype == np.float32:
+        return audio_data
+
+    if audio_data.dtype == np.int16:
+        scale = INT16_SCALE
+    elif audio_data.dtype == np.int32:
+        scale = INT32_SCALE
+    else:
+        return audio_data.astype(np.float32)
+
+    if out is None:
+        return np.multiply(audio_data, scale, dtype=np.float32)
+
+    return np.multiply(audio_data, scale, out=out[:len(audio_data)], dtype=np.float32)
+
+def float_to_int16(audio_data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert float audio in [-1.0, 1.0] to 16-bit PCM.
+
+    Samples outside the valid range saturate instead of wrapping around
+    modulo 2^16, which would otherwise produce audible clicks.
+
+    Args:
+        audio_data: Audio data as numpy array (int16 input is returned unchanged)
+        out: Optional preallocated int16 buffer with at least len(audio_data) samples
+
+    Returns:
+        Audio data as int16 numpy array (a view of out when provided)
+    """
+    if audio_data.dtype == np.int16:
+        return audio_data
+
+    if not np.issubdtype(audio_data.dtype, np.floating):
+        return audio_data.astype(np.int16)
+
+    # Scale, saturate and round in place on a single float32 temporary
+    scaled = np.multiply(audio_data, np.float32(INT16_MAX), dtype=np.float32)
+    np.clip(scaled, INT16_MIN, INT16_MAX, out=scaled)
+    np.rint(scaled, out=scaled)
+
+    if out is None:
+        return scaled.astype(np.int16)
+
+    result = out[:len(scaled)]
+    np.copyto(result, scaled, casting='unsafe')
+    return result
@@ -1,13 +1,18 @@
 """Configuration management for the Google Meet AI Agent."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Load environment variables from .env file, once per process even if this
+# module is imported under two names (src.utils.config and utils.config)
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(env_path, override=True)
+if not os.environ.get("_GMEET_DOTENV_LOADED"):
+    load_dotenv(env_path, override=True)
+    os.environ["_GMEET_DOTENV_LOADED"] = "1"
 
 class Config:
     """Configuration for Google Meet AI Agent using individual service endpoints."""
@@ -50,25 +55,46 @@ class Config:
     AUDIO_DEVICE_OUTPUT = os.getenv("AUDIO_DEVICE_OUTPUT", "BlackHole 2ch")
     SAMPLE_RATE = int(os.getenv("SAMPLE_RATE", "16000"))
     BUFFER_SIZE = int(os.getenv("BUFFER_SIZE", "1024"))  # Audio buffer size in samples
+    AUTO_BUFFER_SIZE = os.getenv("AUTO_BUFFER_SIZE", "false").lower() == "true"  # Probe callback jitter for smallest stable buffer
     CHANNELS = 1  # Mono audio for speech processing
+    CAPTURE_DTYPE = os.getenv("CAPTURE_DTYPE", "int16")  # Native 16-bit PCM ("float32" for legacy float capture)
+    CAPTURE_LATENCY = os.getenv("CAPTURE_LATENCY", "low")  # Input stream latency: "low", "high" or seconds
+    PLAYBACK_DTYPE = os.getenv("PLAYBACK_DTYPE", "int16")  # Output stream sample format ("float32" for float playback)
     
     # === CHROME PROFILE ===
     CHROME_PROFILE_PATH = os.getenv("CHROME_PROFILE_PATH", "gmeet_ai_agent_profile")  # Dedicated profile
     USE_CHROME_PROFILE = os.getenv("USE_CHROME_PROFILE", "true").lower() == "true"
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))  # Agents launched by MeetingController.prewarm()
+    BROWSER_POOL_RECYCLE_AFTER = int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "100"))  # Checkouts before a pooled browser is relaunched
     CHROME_EXECUTABLE_PATH = os.getenv("CHROME_EXECUTABLE_PATH")  # Optional custom Chrome path
     
     # === VOICE ACTIVITY DETECTION ===
     VAD_AGGRESSIVENESS = int(os.getenv("VAD_AGGRESSIVENESS", "1"))  # Less aggressive to capture full speech
     MIN_SPEECH_DURATION = float(os.getenv("MIN_SPEECH_DURATION", "0.3"))  # Faster detection
     MIN_SILENCE_DURATION = float(os.getenv("MIN_SILENCE_DURATION", "1.5"))  # Wait longer before ending
+    SILERO_VAD_MODEL = os.getenv("SILERO_VAD_MODEL")  # Optional path to silero_vad.onnx (needs onnxruntime)
+    SILERO_VAD_THRESHOLD = float(os.getenv("SILERO_VAD_THRESHOLD", "0.5"))
     
     # === AGENT BEHAVIOR ===
     RESPONSE_DELAY = float(os.getenv("RESPONSE_DELAY", "0.5"))
     MAX_CONVERSATION_HISTORY = int(os.getenv("MAX_CONVERSATION_HISTORY", "50"))
     KEEP_MICROPHONE_ON = os.getenv("KEEP_MICROPHONE_ON", "true").lower() == "true"
     
+    # === CACHING ===
+    CACHE_DIR = os.getenv("CACHE_DIR", str(Path.home() / ".cache" / "meetflow"))
+    TRANSCRIPT_CACHE_ENABLED = os.getenv("TRANSCRIPT_CACHE_ENABLED", "false").lower() == "true"  # Opt-in: stores transcript text in plaintext
+    TRANSCRIPT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", str(Path(CACHE_DIR) / "transcripts.sqlite3"))
+    TRANSCRIPT_CACHE_TTL = int(os.getenv("TRANSCRIPT_CACHE_TTL", str(7 * 24 * 3600)))  # Seconds
+    TRANSCRIPT_CACHE_MAX_ENTRIES = int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "10000"))
+    REDIS_URL = os.getenv("REDIS_URL")  # Use Redis instead of SQLite for the transcript cache
+    TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "false").lower() == "true"  # Opt-in: stores spoken replies as audio
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", str(Path(CACHE_DIR) / "tts"))
+    TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "256"))
+    TTS_CACHE_TTL = int(os.getenv("TTS_CACHE_TTL", str(7 * 24 * 3600)))  # Seconds since last use
+    
     # === LOGGING ===
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_SKIP_RECORD_EXTRAS = os.getenv("LOG_SKIP_RECORD_EXTRAS", "false").lower() == "true"  # Opt-in: no caller/thread/process info
     
     # === BACKWARDS COMPATIBILITY ===
     # For unified Azure OpenAI access (fallback to individual services)
@@ -79,28 +105,25 @@ class Config:
     GPT_DEPLOYMENT = GPT_DEPLOYMENT_NAME
     TTS_DEPLOYMENT = TTS_MODEL
     
+    # Settings every individual service needs
+    REQUIRED_SETTINGS = (
+        "WHISPER_ENDPOINT", "WHISPER_API_KEY",
+        "GPT_ENDPOINT", "GPT_API_KEY",
+        "TTS_ENDPOINT", "TTS_API_KEY",
+    )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def missing_settings(cls) -> Tuple[str, ...]:
+        """Get the required settings that are unset (computed once)."""
+        return tuple(name for name in cls.REQUIRED_SETTINGS if not getattr(cls, name))
+    
     @classmethod
     def validate(cls) -> bool:
         """Validate required configuration."""
-        missing = []
-        
-        # Check individual service configurations
-        if not cls.WHISPER_ENDPOINT:
-            missing.append("WHISPER_ENDPOINT")
-        if not cls.WHISPER_API_KEY:
-            missing.append("WHISPER_API_KEY")
-        if not cls.GPT_ENDPOINT:
-            missing.append("GPT_ENDPOINT")
-        if not cls.GPT_API_KEY:
-            missing.append("GPT_API_KEY")
-        if not cls.TTS_ENDPOINT:
-            missing.append("TTS_ENDPOINT")
-        if not cls.TTS_API_KEY:
-            missing.append("TTS_API_KEY")
-        
+        missing = cls.missing_settings()
         if missing:
-            for item in missing:
-                print(f"❌ {item} is required")
+            print("\n".join(f"❌ {item} is required" for item in missing))
             return False
         
         return True
@@ -108,52 +131,56 @@ class Config:
     @classmethod
     def print_status(cls):
         """Print current configuration status."""
-        print("🔧 GMeet AI Agent Configuration")
-        print("=" * 40)
-        print(f"Agent Name: {cls.AGENT_NAME}")
-        print(f"Meeting URL: {cls.GMEET_URL}")
-        print(f"Chrome Profile: {'✅' if cls.USE_CHROME_PROFILE else '❌'}")
-        
         # Check individual services
         whisper_ok = bool(cls.WHISPER_ENDPOINT and cls.WHISPER_API_KEY)
         gpt_ok = bool(cls.GPT_ENDPOINT and cls.GPT_API_KEY)
         tts_ok = bool(cls.TTS_ENDPOINT and cls.TTS_API_KEY)
         
-        print(f"Whisper STT: {'✅' if whisper_ok else '❌'}")
-        print(f"GPT Chat: {'✅' if gpt_ok else '❌'}")
-        print(f"TTS Speech: {'✅' if tts_ok else '❌'}")
-        print(f"Audio Input: {cls.AUDIO_DEVICE_INPUT}")
-        print(f"Audio Output: {cls.AUDIO_DEVICE_OUTPUT}")
-        print("=" * 40)
+        print("\n".join([
+            "🔧 GMeet AI Agent Configuration",
+            "=" * 40,
+            f"Agent Name: {cls.AGENT_NAME}",
+            f"Meeting URL: {cls.GMEET_URL}",
+            f"Chrome Profile: {'✅' if cls.USE_CHROME_PROFILE else '❌'}",
+            f"Whisper STT: {'✅' if whisper_ok else '❌'}",
+            f"GPT Chat: {'✅' if gpt_ok else '❌'}",
+            f"TTS Speech: {'✅' if tts_ok else '❌'}",
+            f"Audio Input: {cls.AUDIO_DEVICE_INPUT}",
+            f"Audio Output: {cls.AUDIO_DEVICE_OUTPUT}",
+            "=" * 40
+        ]))
     
     @classmethod
-    def get_whisper_config(cls) -> Dict[str, Any]:
-        """Get Whisper configuration."""
-        return {
+    @lru_cache(maxsize=None)
+    def get_whisper_config(cls) -> Mapping[str, Any]:
+        """Get Whisper configuration (built once, read-only)."""
+        return MappingProxyType({
             "azure_endpoint": cls.WHISPER_ENDPOINT,
             "api_key": cls.WHISPER_API_KEY,
             "api_version": cls.WHISPER_API_VERSION,
             "deployment_name": cls.WHISPER_DEPLOYMENT_NAME,
             "language": cls.WHISPER_LANGUAGE,
             "temperature": cls.WHISPER_TEMPERATURE
-        }
+        })
     
     @classmethod
-    def get_gpt_config(cls) -> Dict[str, Any]:
-        """Get GPT configuration."""
-        return {
+    @lru_cache(maxsize=None)
+    def get_gpt_config(cls) -> Mapping[str, Any]:
+        """Get GPT configuration (built once, read-only)."""
+        return MappingProxyType({
             "azure_endpoint": cls.GPT_ENDPOINT,
             "api_key": cls.GPT_API_KEY,
             "api_version": cls.GPT_API_VERSION,
             "deployment_name": cls.GPT_DEPLOYMENT_NAME,
             "max_tokens": cls.GPT_MAX_TOKENS,
             "temperature": cls.GPT_TEMPERATURE
-        }
+        })
     
     @classmethod
-    def get_tts_config(cls) -> Dict[str, Any]:
-        """Get TTS configuration."""
-        return {
+    @lru_cache(maxsize=None)
+    def get_tts_config(cls) -> Mapping[str, Any]:
+        """Get TTS configuration (built once, read-only)."""
+        return MappingProxyType({
             "azure_endpoint": cls.TTS_ENDPOINT,
             "api_key": cls.TTS_API_KEY,
             "api_version": cls.TTS_API_VERSION,
@@ -161,4 +188,4 @@ class Config:
             "voice": cls.TTS_VOICE,
             "speed": cls.TTS_SPEED,
             "response_format": cls.TTS_FORMAT
-        } 
\ No newline at end of file
+        }) 
\ No newline at end of file
@@ -1,11 +1,44 @@
 """Logging utilities for the Google Meet AI Agent."""
 
+import atexit
+import io
 import logging
+import os
+import queue
 import sys
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
 
-class ColoredFormatter(logging.Formatter):
+RESET_CODE = '\033[0m'
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = -1
+        self._last_time = ''
+        
+        # The base class searches the format string for %(asctime) on every record
+        self._uses_time = super().usesTime()
+    
+    def usesTime(self):
+        return self._uses_time
+    
+    def formatTime(self, record, datefmt=None):
+        # The default format has milliseconds, so it can't be reused across records
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time = time.strftime(datefmt, self.converter(second))
+            self._last_second = second
+        return self._last_time
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colors for different log levels."""
     
     # ANSI color codes
@@ -15,68 +48,224 @@ class ColoredFormatter(logging.Formatter):
         'WARNING': '\033[33m',  # Yellow
         'ERROR': '\033[31m',    # Red
         'CRITICAL': '\033[35m', # Magenta
-        'RESET': '\033[0m'      # Reset
+        'RESET': RESET_CODE     # Reset
+    }
+    
+    # Colored level names, built once instead of per record
+    COLORED_LEVELS = {
+        name: f"{code}{name}{RESET_CODE}"
+        for name, code in COLORS.items() if name != 'RESET'
     }
 
-    def format(self, record):
-        # Add color to level name
+    def format(self, record, _colored=COLORED_LEVELS):
+        # Add color to level name (table bound as a default so it's a local lookup)
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        record.levelname = _colored.get(levelname, levelname)
+        
+        try:
+            return super().format(record)
+        finally:
+            # Reset levelname for future records
+            record.levelname = levelname
+
+class BatchingStreamHandler(logging.StreamHandler):
+    """Stream handler that writes and flushes once per burst of records instead of after each one."""
+    
+    def __init__(self, stream, pending: "queue.Queue[logging.LogRecord]"):
+        """Initialize handler.
+        
+        Args:
+            stream: Buffered text stream to write to
+            pending: Queue feeding this handler; the stream is flushed when it runs empty
+        """
+        super().__init__(stream)
+        self.pending = pending
+        self._lines = []
+    
+    def emit(self, record):
+        try:
+            self._lines.append(self.format(record))
+            if record.levelno >= logging.WARNING or self.pending.empty():
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        # One write (and so one encode) for the whole burst
+        self.acquire()
+        try:
+            if self._lines:
+                self._lines.append('')
+                text = self.terminator.join(self._lines)
+                self._lines.clear()
+                self.stream.write(text)
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        finally:
+            self.release()
+
+class ThrottleFilter(logging.Filter):
+    """Drop repeats of the same message template within an interval.
+    
+    Records are keyed by logger name and the unformatted message, so a call
+    site logging "%d frames" at audio cadence is emitted at most once per
+    interval while other messages pass through. Warnings and errors are
+    never dropped.
+    """
+    
+    def __init__(self, interval: float):
+        """Initialize filter.
+        
+        Args:
+            interval: Minimum seconds between records with the same template
+        """
+        super().__init__()
+        self.interval = interval
+        self._last: Dict[Tuple[str, object], float] = {}
+    
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        if now - self._last.get(key, -self.interval) < self.interval:
+            return False
+        self._last[key] = now
+        return True
+
+def _buffered_stdout():
+    """Get a 64 KiB block-buffered writer on stdout's descriptor (stdout itself if it has none)."""
+    try:
+        return os.fdopen(sys.stdout.fileno(), "w",
+                         buffering=64 * 1024,
+                         encoding=sys.stdout.encoding,
+                         errors=sys.stdout.errors,
+                         closefd=False)
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return sys.stdout
+
+# Records from every logger go through one queue; a single listener thread
+# formats them and writes to stdout, so callers never block on the write
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+# Numeric levels by name
+_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+# Level and throttle each logger was last set up with, so repeat setup_logger calls are a lookup
+_configured: Dict[str, Tuple[str, float]] = {}
+
+def _ensure_listener() -> None:
+    """Start the console listener once per process (stopped and flushed at exit)."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
         
-        # Format the message
-        formatted = super().format(record)
+        # Create console handler
+        console_handler = BatchingStreamHandler(_buffered_stdout(), _log_queue)
         
-        # Reset levelname for future records
-        record.levelname = levelname
+        # Create formatter; plain output when piped or NO_COLOR is set
+        fmt = '%(asctime)s | %(levelname)s | %(name)s | %(message)s'
+        use_color = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+        if use_color:
+            formatter = ColoredFormatter(fmt, datefmt='%H:%M:%S', validate=False)
+        else:
+            formatter = CachedTimeFormatter(fmt, datefmt='%H:%M:%S', validate=False)
+        console_handler.setFormatter(formatter)
         
-        return formatted
+        _listener = QueueListener(_log_queue, console_handler, respect_handler_level=True)
+        _listener.start()
+        
+        # Exit handlers run last-in first-out: drain the queue, then flush
+        atexit.register(console_handler.flush)
+        atexit.register(_listener.stop)
 
-def setup_logger(name: str = "gmeet_ai_agent", level: str = "INFO") -> logging.Logger:
-    """Set up a logger with colored output."""
+def setup_logger(name: str = "gmeet_ai_agent", level: str = "INFO", throttle: float = 0.0) -> logging.Logger:
+    """Set up a logger with colored output.
+    
+    Args:
+        name: Logger name
+        level: Level name
+        throttle: If set, repeats of a message template within this many seconds are dropped
+    """
     
+    level = level.upper()
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    if _configured.get(name) == (level, throttle):
+        return logger
+    
+    numeric_level = _LEVELS.get(level, logging.INFO)
+    logger.setLevel(numeric_level)
     
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    # Hand records to the shared listener instead of writing on this thread
+    _ensure_listener()
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.setLevel(numeric_level)
     
-    # Create formatter
-    formatter = ColoredFormatter(
-        '%(asctime)s | %(levelname)s | %(name)s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
+    # Filter on the caller's side so throttled records are never queued
+    if throttle > 0:
+        queue_handler.addFilter(ThrottleFilter(throttle))
     
     # Add handler to logger
-    logger.addHandler(console_handler)
+    logger.addHandler(queue_handler)
     
+    _configured[name] = (level, throttle)
     return logger
 
 def log_audio_info(logger: logging.Logger, device_info: dict) -> None:
     """Log audio device information."""
-    logger.info("🎵 Audio Device Info:")
-    logger.info(f"   Device: {device_info.get('name', 'Unknown')}")
-    logger.info(f"   Channels: {device_info.get('max_input_channels', 0)} in / {device_info.get('max_output_channels', 0)} out")
-    logger.info(f"   Sample Rate: {device_info.get('default_samplerate', 'Unknown')}Hz")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("🎵 Audio Device Info:\n   Device: %s\n   Channels: %s in / %s out\n   Sample Rate: %sHz",
+                device_info.get('name', 'Unknown'),
+                device_info.get('max_input_channels', 0),
+                device_info.get('max_output_channels', 0),
+                device_info.get('default_samplerate', 'Unknown'))
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten text to limit characters plus an ellipsis; short text is returned as is."""
+    return text if len(text) <= limit else text[:limit] + '...'
 
 def log_ai_response(logger: logging.Logger, transcription: str, response: str, processing_time: float) -> None:
     """Log AI processing information."""
-    logger.info("🤖 AI Processing:")
-    logger.info(f"   Transcription: '{transcription[:100]}{'...' if len(transcription) > 100 else ''}'")
-    logger.info(f"   Response: '{response[:100]}{'...' if len(response) > 100 else ''}'")
-    logger.info(f"   Processing Time: {processing_time:.2f}s")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("🤖 AI Processing:\n   Transcription: '%s'\n   Response: '%s'\n   Processing Time: %.2fs",
+                _truncate(transcription), _truncate(response), processing_time)
 
 def log_meeting_event(logger: logging.Logger, event: str, details: Optional[str] = None) -> None:
     """Log meeting-related events."""
-    logger.info(f"📞 Meeting Event: {event}")
+    if not logger.isEnabledFor(logging.INFO):
+        return
     if details:
-        logger.info(f"   Details: {details}")
+        logger.info("📞 Meeting Event: %s\n   Details: %s", event, details)
+    else:
+        logger.info("📞 Meeting Event: %s", event)
+
+def skip_record_extras() -> None:
+    """Stop collecting caller, thread and process details for every record.
+    
+    Our format only uses time, level, name and message (see the logging
+    HOWTO's "Optimization" section). This changes the logging module for the
+    whole process, so only applications that own their logging should call
+    it; formats that add %(lineno)d, %(threadName)s or %(process)d will then
+    show placeholder values.
+    """
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-# Global logger instance
-logger = setup_logger() 
\ No newline at end of file
+def get_logger() -> logging.Logger:
+    """Get the global agent logger, set up on first call rather than at import."""
+    return setup_logger()
+ 
\ No newline at end of file